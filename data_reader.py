@@ -3,19 +3,135 @@
 Simple utility to read and traverse JSON files in data directories.
 """
 
+import asyncio
+import copy
 import json
+import logging
+import mmap
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Generator, Optional
+from typing import Awaitable, Callable, Dict, Any, Generator, Iterable, List, Optional, Tuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 
-def traverse_json_files(limit: int = 10, data_path: str = "data/EthCC[8]RedfordStage") -> Generator[Dict[str, Any], None, None]:
+# Decode errors raised by the available JSON backends; orjson.JSONDecodeError
+# already subclasses json.JSONDecodeError, but ujson's does not
+JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+if ujson is not None:
+    JSON_DECODE_ERRORS += (getattr(ujson, 'JSONDecodeError', ValueError),)
+
+logger = logging.getLogger(__name__)
+
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _parse_json_bytes(raw: bytes) -> Any:
+    """
+    Parse raw JSON bytes with the fastest available backend.
+    
+    Prefers orjson, then ujson, and only falls back to the stdlib decoder
+    when neither is installed. Callers handle JSON_DECODE_ERRORS.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_bytes(file_path) -> bytes:
+    """Read a file's raw contents."""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def _load_json(file_path) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    With orjson, files of at least MMAP_THRESHOLD bytes are memory-mapped and
+    parsed in place, avoiding an intermediate bytes copy of large transcripts.
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            return orjson.loads(f.read())
+    
+    return _parse_json_bytes(_read_bytes(file_path))
+
+
+def _read_ahead(paths: Iterable[str], max_inflight: int = 16) -> Generator[Tuple[str, Future], None, None]:
+    """
+    Read files on a thread pool, keeping up to `max_inflight` reads ahead.
+    
+    Yields (path, future) pairs in input order; future.result() returns the
+    file's bytes or raises the read error. Paths are consumed lazily, so
+    stopping early does not read the rest of the tree.
+    """
+    with ThreadPoolExecutor(max_workers=max_inflight) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append((path, executor.submit(_read_bytes, path)))
+            if len(pending) >= max_inflight:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file once per (path, mtime, size) combination.
+    
+    The stat fields are only part of the cache key so that a rewritten
+    file is parsed again instead of being served stale.
+    """
+    return _load_json(path_str)
+
+
+def _iter_json_paths(root: str) -> Generator[str, None, None]:
+    """Walk a directory tree with os.scandir, yielding paths of .json files."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json'):
+                    yield entry.path
+
+
+def traverse_json_files(limit: int = 10, data_path: str = "data/EthCC[8]RedfordStage",
+                        skip_path: Optional[Callable[[str], bool]] = None,
+                        skip: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Generator[Dict[str, Any], None, None]:
     """
     Traverse JSON files in a directory and yield their contents.
     
     Args:
-        limit: Maximum number of JSON files to read (default: 10)
+        limit: Maximum number of JSON files to yield (default: 10)
         data_path: Path to directory containing JSON files (default: "data")
+        skip_path: Called with each file path before reading; files it accepts are
+                   neither read nor counted toward the limit
+        skip: Called with each parsed file; files it accepts are not yielded and
+              not counted toward the limit
         
     Yields:
         Dict containing JSON data from each file, with added metadata:
@@ -26,55 +142,63 @@ def traverse_json_files(limit: int = 10, data_path: str = "data/EthCC[8]RedfordS
     data_dir = Path(data_path)
     
     if not data_dir.exists():
-        print(f"❌ Directory '{data_path}' does not exist")
+        logger.error(f"Directory '{data_path}' does not exist")
         return
     
     if not data_dir.is_dir():
-        print(f"❌ '{data_path}' is not a directory")
+        logger.error(f"'{data_path}' is not a directory")
         return
     
     files_processed = 0
     
-    # Recursively find all JSON files
-    json_files = list(data_dir.rglob("*.json"))
+    logger.debug(f"Scanning '{data_path}' for up to {limit} JSON files")
     
-    print(f"📁 Found {len(json_files)} JSON files in '{data_path}'")
-    print(f"🔢 Processing up to {limit} files...")
-    print("-" * 50)
+    # Recursively walk JSON files, reading ahead while earlier files are parsed,
+    # and stop as soon as the limit is reached
+    paths = _iter_json_paths(data_path)
+    if skip_path is not None:
+        paths = (path for path in paths if not skip_path(path))
     
-    for json_file in json_files:
+    for json_file, raw in _read_ahead(paths, max_inflight=min(limit, 16) or 1):
         if files_processed >= limit:
-            print(f"✅ Reached limit of {limit} files")
+            logger.debug(f"Reached limit of {limit} files")
             break
             
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _parse_json_bytes(raw.result())
+            file_name = os.path.basename(json_file)
             
             # Add metadata about the file
-            data['_file_path'] = str(json_file)
-            data['_file_name'] = json_file.name
-            data['_directory'] = json_file.parent.name
+            data['_file_path'] = json_file
+            data['_file_name'] = file_name
+            data['_directory'] = os.path.basename(os.path.dirname(json_file))
             
-            print(f"📄 {files_processed + 1}. {json_file.name}")
+            if skip is not None and skip(data):
+                continue
+            
+            logger.debug(f"{files_processed + 1}. {file_name}")
             
             yield data
             files_processed += 1
             
-        except json.JSONDecodeError as e:
-            print(f"❌ Error reading {json_file}: Invalid JSON - {e}")
+        except JSON_DECODE_ERRORS as e:
+            logger.error(f"Error reading {json_file}: Invalid JSON - {e}")
             continue
         except Exception as e:
-            print(f"❌ Error reading {json_file}: {e}")
+            logger.error(f"Error reading {json_file}: {e}")
             continue
     
-    print(f"\n✅ Processed {files_processed} JSON files")
+    logger.debug(f"Processed {files_processed} JSON files")
 
 
 def read_json_file(file_path: str) -> Optional[Dict[str, Any]]:
     """
     Read a single JSON file and return its contents.
     
+    Parsed results are cached per file path and invalidated when the
+    file's modification time or size changes. Callers receive a shallow
+    copy, so adding top-level keys does not affect the cached data.
+    
     Args:
         file_path: Path to the JSON file
         
@@ -82,26 +206,35 @@ def read_json_file(file_path: str) -> Optional[Dict[str, Any]]:
         Dictionary containing JSON data or None if error
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
-    except json.JSONDecodeError as e:
-        print(f"❌ Error reading {file_path}: Invalid JSON - {e}")
+        stat = os.stat(file_path)
+        data = _parse_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+        return copy.copy(data)
+    except JSON_DECODE_ERRORS as e:
+        logger.error(f"Error reading {file_path}: Invalid JSON - {e}")
         return None
     except FileNotFoundError:
-        print(f"❌ File not found: {file_path}")
+        logger.error(f"File not found: {file_path}")
         return None
     except Exception as e:
-        print(f"❌ Error reading {file_path}: {e}")
+        logger.error(f"Error reading {file_path}: {e}")
         return None
 
 
-def list_json_files(data_path: str = "data") -> list:
+def _scan_subtree(root: str) -> List[str]:
+    """Collect the JSON file paths under a single directory tree."""
+    return list(_iter_json_paths(root))
+
+
+def list_json_files(data_path: str = "data", max_workers: int = 8) -> list:
     """
     List all JSON files in a directory.
     
+    Top-level subdirectories are walked in parallel on a thread pool, since
+    os.scandir releases the GIL while waiting on the filesystem.
+    
     Args:
         data_path: Path to directory containing JSON files
+        max_workers: Maximum number of subdirectories scanned concurrently
         
     Returns:
         List of Path objects for JSON files
@@ -109,20 +242,75 @@ def list_json_files(data_path: str = "data") -> list:
     data_dir = Path(data_path)
     
     if not data_dir.exists():
-        print(f"❌ Directory '{data_path}' does not exist")
+        logger.error(f"Directory '{data_path}' does not exist")
+        return []
+    
+    if not data_dir.is_dir():
+        logger.error(f"'{data_path}' is not a directory")
         return []
     
-    json_files = list(data_dir.rglob("*.json"))
+    paths = []
+    subdirs = []
+    with os.scandir(data_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.json'):
+                paths.append(entry.path)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for subtree_paths in executor.map(_scan_subtree, subdirs):
+            paths.extend(subtree_paths)
     
-    print(f"📁 Found {len(json_files)} JSON files in '{data_path}':")
-    for i, file_path in enumerate(json_files, 1):
-        relative_path = file_path.relative_to(data_dir)
-        print(f"  {i}. {relative_path}")
+    json_files = [Path(path) for path in paths]
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Found {len(json_files)} JSON files in '{data_path}':\n" + "\n".join(
+            f"  {i}. {os.path.relpath(path, data_path)}" for i, path in enumerate(paths, 1)
+        ))
     
     return json_files
 
 
 # Example usage functions
+async def map_json_files(files: Iterable, handle: Callable[[int, Dict[str, Any]], Awaitable[Any]],
+                         max_concurrency: int = 8) -> List[Any]:
+    """
+    Read JSON files and pass each to an async handler, with bounded concurrency.
+    
+    Each worker reads its next file in a thread while its current handler
+    call is in flight, so at most one read per worker is prefetched.
+    
+    Args:
+        files: Paths of JSON files
+        handle: Called as handle(index, data) for each file that could be read
+        max_concurrency: Maximum number of handler calls in flight
+        
+    Returns:
+        Handler results in the same order as files; None for unreadable files
+    """
+    loop = asyncio.get_running_loop()
+    entries = enumerate(files)
+    results = {}
+    
+    def _prefetch():
+        index, path = next(entries, (None, None))
+        if path is None:
+            return None
+        return index, loop.run_in_executor(None, read_json_file, path)
+    
+    async def _worker():
+        pending = _prefetch()
+        while pending is not None:
+            index, read = pending
+            json_data = await read
+            pending = _prefetch()
+            results[index] = await handle(index, json_data) if json_data is not None else None
+    
+    await asyncio.gather(*[_worker() for _ in range(max_concurrency)])
+    return [results[index] for index in sorted(results)]
+
+
 def example_usage():
     """Example of how to use the traverse_json_files function."""
     
@@ -151,4 +339,5 @@ def example_usage():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     example_usage() 
\ No newline at end of file
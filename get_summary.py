@@ -1,24 +1,14 @@
 import asyncio
+import re
 from workers.llm_process import LLMProcess, PromptType, LLMConfig
+from data_reader import list_json_files, map_json_files
+from llm_cache import get_or_call, make_key
 import dotenv
 
 dotenv.load_dotenv()
 
-async def summarize_json_transcript(json_input):
-    # Create custom LLM configuration
-    config = LLMConfig(
-        model_name="gpt-4.1",
-        temperature=0.2,
-        max_tokens=16384
-    )
-    
-    # Extract the specific fields from the JSON data
-    video_title = json_input.get("video_title", "Unknown Title")
-    description = json_input.get("description", "No description available")
-    transcript_text = json_input.get("transcript", {}).get("aggregated_text", "No transcript available")
-    
-    # Pre-format the custom prompt with the extracted values
-    custom_prompt = f"""
+# Summary prompt; filled in per transcript with str.format_map
+PROMPT_TEMPLATE = """
 You are an expert technical writer and editor specializing in artificial intelligence and emerging technologies. You excel at transforming complex transcripts into clear, structured, and engaging articles for both technical and non-technical audiences. Your approach is analytical and factual: you rely solely on the given transcript, avoid assumptions, and organize information in a logical, reader-friendly way. Your writing is concise, professional, and geared toward conveying both the details and the significance of the topic.
 * **Video Title:** {video_title}
 * **Video Description:** {description}
@@ -69,28 +59,220 @@ Begin only after fully processing the transcript content. Do not summarize—wri
 
 # Begin only after fully processing the transcript content. Do not summarize. Write a detailed, structured article.
 # """
-    
-    # Use process_text_with_prompt with the pre-formatted prompt
-    result = await LLMProcess.process_text_with_prompt(
-        text_data=custom_prompt,
-        provider_name="openai",
-        config=config
+
+# Batch prompt; one "--- FILE {id} ---" block per transcript in {files}
+BATCH_PROMPT_TEMPLATE = """
+You are an expert technical writer and editor specializing in artificial intelligence and emerging technologies. You rely solely on the given transcripts, avoid assumptions, and organize information in a logical, reader-friendly way.
+Below are {count} separate video transcripts, each starting with a "--- FILE <id> ---" line.
+
+{files}
+**Instructions:**
+Handle each file independently. For each one, segment its transcript into three logical sections based strictly on its content:
+
+1. What it is: Explain what the topic, tool, or concept is.
+
+2. How it works: Describe how it functions, operates, or is used.
+
+3. Why it matters: Summarize its significance, impact, or relevance.
+
+Use only information from that file's transcript and never mix content between files.
+
+Start each file's output with a line "### FILE <id>" and nothing else, in the same order as the input, then format it as follows:
+
+What it is: [Your summary here in bullet points]
+
+How it works: [Your summary here in bullet points]
+
+Why it matters: [Your summary here in bullet points]
+
+Output exactly one block for each of these file ids: {file_ids}
+"""
+
+BATCH_FILE_TEMPLATE = """--- FILE {file_id} ---
+* **Video Title:** {video_title}
+* **Video Description:** {description}
+* **Transcript:** {transcript_text}
+"""
+
+BATCH_HEADER_PATTERN = re.compile(r"^#{1,3}\s*FILE\s+(\d+)\s*$", re.MULTILINE)
+
+
+def summary_config():
+    """LLM configuration used for transcript summaries."""
+    return LLMConfig(
+        model_name="gpt-4.1",
+        temperature=0.2,
+        max_tokens=16384
     )
+
+
+def prompt_fields(json_input):
+    """Extract the prompt placeholders from a transcript JSON."""
+    return {
+        "video_title": json_input.get("video_title", "Unknown Title"),
+        "description": json_input.get("description", "No description available"),
+        "transcript_text": json_input.get("transcript", {}).get("aggregated_text", "No transcript available")
+    }
+
+
+async def complete_prompt(prompt, config):
+    """Send a pre-formatted prompt, reusing the on-disk response when available."""
+    async def _call():
+        # Use process_text_with_prompt with the pre-formatted prompt
+        result = await LLMProcess.process_text_with_prompt(
+            text_data=prompt,
+            provider_name="openai",
+            config=config
+        )
+        
+        if not result.success:
+            print("Error:", result.error)
+            return None
+        return result.result
     
-    if result.success:
-        print("Analysis result:", result.result)
-    else:
-        print("Error:", result.error)
+    # Reuse the on-disk response when this exact prompt was already summarized
+    return await get_or_call(make_key(config, prompt), _call)
 
-# Run the analysis
-# Load JSON data from file
-import json
-from pathlib import Path
 
-json_file = Path("data/Anthropic_InverseScalinginTest-TimeCompute/Anthropic_InverseScalinginTest-TimeCompute_dkmGW6PnYNE.json")
+async def summarize_json_transcript(json_input):
+    config = summary_config()
+    
+    # Format the prompt template with the extracted values
+    custom_prompt = PROMPT_TEMPLATE.format_map(prompt_fields(json_input))
+    response = await complete_prompt(custom_prompt, config)
+    
+    if response is not None:
+        print("Analysis result:", response)
+    
+    return response
+
 
+def pack_entries(blocks, max_tokens_in):
+    """
+    Greedily group file blocks so each group stays under the token budget.
+    
+    Tokens are estimated as len(text) // 4; a block that alone exceeds the
+    budget gets a group of its own.
+    """
+    groups = []
+    current, current_tokens = [], 0
+    for index, block in enumerate(blocks):
+        tokens = len(block) // 4
+        if current and current_tokens + tokens > max_tokens_in:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    json_data = json.load(f)
 
-asyncio.run(summarize_json_transcript(json_data))
\ No newline at end of file
+def split_batch_response(response, file_ids):
+    """
+    Split a batch response into per-file summaries.
+    
+    Returns:
+        Dict of file id to summary, or None if any expected block is missing
+    """
+    parts = BATCH_HEADER_PATTERN.split(response)
+    summaries = {}
+    for file_id, body in zip(parts[1::2], parts[2::2]):
+        body = body.strip()
+        if body:
+            summaries[int(file_id)] = body
+    if not set(file_ids) <= summaries.keys():
+        return None
+    return summaries
+
+
+async def summarize_batch(entries, max_tokens_in: int = 12000):
+    """
+    Summarize several transcripts with as few LLM requests as possible.
+    
+    Small transcripts are packed into one prompt under the max_tokens_in
+    budget and the response is split on its "### FILE <id>" headers. A group
+    whose response cannot be split falls back to one request per entry.
+    
+    Args:
+        entries: Transcript JSON dicts
+        max_tokens_in: Estimated input token budget per request
+        
+    Returns:
+        Summaries (or None on failure) in the same order as entries
+    """
+    config = summary_config()
+    blocks = [
+        BATCH_FILE_TEMPLATE.format_map({"file_id": index, **prompt_fields(entry)})
+        for index, entry in enumerate(entries)
+    ]
+    results = [None] * len(entries)
+    
+    async def _run_group(group):
+        if len(group) == 1:
+            results[group[0]] = await summarize_json_transcript(entries[group[0]])
+            return
+        
+        prompt = BATCH_PROMPT_TEMPLATE.format_map({
+            "count": len(group),
+            "files": "\n".join(blocks[index] for index in group),
+            "file_ids": ", ".join(map(str, group))
+        })
+        response = await complete_prompt(prompt, config)
+        summaries = split_batch_response(response, group) if response is not None else None
+        
+        if summaries is None:
+            print(f"Could not split batch of {len(group)} files, summarizing individually")
+            for index in group:
+                results[index] = await summarize_json_transcript(entries[index])
+            return
+        
+        for index in group:
+            results[index] = summaries[index]
+            print("Analysis result:", summaries[index])
+    
+    semaphore = asyncio.Semaphore(LLMProcess.MAX_CONCURRENCY["openai"])
+    
+    async def _bounded(group):
+        async with semaphore:
+            await _run_group(group)
+    
+    await asyncio.gather(*[_bounded(group) for group in pack_entries(blocks, max_tokens_in)])
+    return results
+
+
+async def run_pipeline(data_path: str, limit: int = 100,
+                       num_workers: int = LLMProcess.MAX_CONCURRENCY["openai"],
+                       max_tokens_in: int = 12000):
+    """
+    Summarize up to `limit` transcripts, reading files ahead of the in-flight LLM calls.
+    
+    Transcripts too large to share a request are summarized as soon as they
+    are read; the rest are packed into shared requests by summarize_batch
+    once every file has been read.
+    """
+    files = list_json_files(data_path)[:limit]
+    small = {}
+    
+    async def _summarize(index, json_data):
+        if len(prompt_fields(json_data)["transcript_text"]) // 4 <= max_tokens_in // 2:
+            small[index] = json_data
+            return None
+        try:
+            return await summarize_json_transcript(json_data)
+        except Exception as e:
+            print(f"Error summarizing {files[index]}: {e}")
+            return None
+    
+    try:
+        results = await map_json_files(files, _summarize, num_workers)
+        if small:
+            summaries = await summarize_batch(list(small.values()), max_tokens_in)
+            for index, summary in zip(small, summaries):
+                results[index] = summary
+        return results
+    finally:
+        await LLMProcess.aclose()
+
+# Run the analysis on the transcript directory
+asyncio.run(run_pipeline("data/Anthropic_InverseScalinginTest-TimeCompute"))
\ No newline at end of file
@@ -1,5 +1,6 @@
 import asyncio
 from workers.llm_process import LLMProcess, PromptType, LLMConfig
+from data_reader import list_json_files, map_json_files
 
 async def summarize_json_transcript_alternative(json_input):
     # Create custom LLM configuration
@@ -43,15 +44,23 @@ Begin only after fully processing the transcript content. Do not summarize—wri
         print("Analysis result:", result.result)
     else:
         print("Error:", result.error)
+    
+    return result
 
-# Run the analysis
-# Load JSON data from file
-import json
-from pathlib import Path
 
-json_file = Path("data/EthCC[8]RedfordStage/AdamLevine(Fireblocks)-UnlockingthePotentialofCross-ChainBridgingforEnterprises_jTf3MNp6S7E.json")
+async def run_batch(files, max_concurrency: int = LLMProcess.MAX_CONCURRENCY["openai"]):
+    """Summarize several JSON transcript files concurrently, reading ahead of the LLM calls."""
+    try:
+        return await map_json_files(
+            files,
+            lambda index, json_data: summarize_json_transcript_alternative(json_data),
+            max_concurrency
+        )
+    finally:
+        await LLMProcess.aclose()
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    json_data = json.load(f)
+# Run the analysis
+# Load JSON data from the transcript directory
+json_files = list_json_files("data/EthCC[8]RedfordStage")
 
-asyncio.run(summarize_json_transcript_alternative(json_data)) 
\ No newline at end of file
+asyncio.run(run_batch(json_files)) 
\ No newline at end of file
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for LLM responses, backed by SQLite.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from llm_providers import LLMConfig
+
+
+DEFAULT_CACHE_PATH = ".cache/llm_responses.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+def make_key(config: LLMConfig, prompt: str) -> bytes:
+    """
+    Build a cache key from the settings that determine an LLM response.
+    
+    Args:
+        config: Generation settings; model, temperature, max_tokens and any
+                additional parameters all take part in the key
+        prompt: Full prompt text
+        
+    Returns:
+        32-byte blake2b digest
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    extra = json.dumps(config.additional_params or {}, sort_keys=True, default=str)
+    for part in (config.model_name, str(config.temperature), str(config.max_tokens), extra, prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.digest()
+
+
+class LLMCache:
+    """SQLite-backed store of LLM responses keyed by prompt digest."""
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: SQLite database file, created if missing
+            ttl: Seconds before a stored response expires; None keeps responses forever
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        # get_or_call runs queries on worker threads, so serialize access
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key BLOB PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def _oldest_live(self) -> float:
+        """Earliest timestamp of an unexpired entry."""
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+    
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached response for a key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND ts >= ?", (key, self._oldest_live())
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: bytes, response: str):
+        """Store a response for a key, dropping expired entries."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time()))
+            )
+            self._conn.execute("DELETE FROM responses WHERE ts < ?", (self._oldest_live(),))
+            self._conn.commit()
+    
+    async def get_or_call(self, key: bytes, call: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        Return the cached response for a key, calling the LLM on a miss.
+        
+        Database access runs in a worker thread so it does not block the event loop.
+        
+        Args:
+            key: Cache key from make_key()
+            call: Factory for the coroutine that produces the response;
+                  a None result is returned but not cached
+                  
+        Returns:
+            Cached or freshly generated response
+        """
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            return cached
+        
+        response = await call()
+        if response is not None:
+            await asyncio.to_thread(self.set, key, response)
+        return response
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[LLMCache] = None
+
+
+def get_default_cache() -> LLMCache:
+    """Get or create the shared cache at DEFAULT_CACHE_PATH."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMCache()
+    return _default_cache
+
+
+async def get_or_call(key: bytes, call: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+    """Look up a response in the shared cache, calling the LLM on a miss."""
+    return await get_default_cache().get_or_call(key, call)
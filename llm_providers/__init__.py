@@ -1,12 +1,27 @@
 from .base import BaseLLMProvider, LLMConfig
-from .openai_provider import OpenAIProvider
-from .anthropic_provider import AnthropicProvider
 from .factory import LLMProviderFactory
+from .rate_limiter import RateLimiter
+
+# Provider classes are imported on first access so that importing the
+# package does not load every provider module
+_LAZY_PROVIDERS = {
+    "OpenAIProvider": ".openai_provider",
+    "AnthropicProvider": ".anthropic_provider"
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_PROVIDERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseLLMProvider",
     "LLMConfig", 
     "OpenAIProvider",
     "AnthropicProvider",
-    "LLMProviderFactory"
+    "LLMProviderFactory",
+    "RateLimiter"
 ] 
\ No newline at end of file
@@ -1,16 +1,24 @@
 from .base import BaseLLMProvider, LLMConfig
-from typing import Dict, List, Optional
+from .rate_limiter import estimate_tokens
+from typing import Any, Dict, List, Optional, AsyncIterator, Tuple
 import os
-try:
-    import anthropic
-except ImportError:
-    anthropic = None
-import json
+
+
+def _import_sdk():
+    """Import the Anthropic SDK on first use so loading this module stays cheap"""
+    try:
+        import anthropic
+    except ImportError:
+        return None
+    return anthropic
+
 
 class AnthropicProvider(BaseLLMProvider):
+    RATE_LIMIT_PROFILE = {"requests_per_minute": 50, "tokens_per_minute": 80000}
+    
     def __init__(self):
         super().__init__()
-        self.client: Optional[anthropic.AsyncAnthropic] = None
+        self.client: Optional["anthropic.AsyncAnthropic"] = None
         self._api_key: Optional[str] = None
     
     def get_api_key(self) -> Optional[str]:
@@ -19,13 +27,25 @@ class AnthropicProvider(BaseLLMProvider):
             self._api_key = os.getenv("ANTHROPIC_API_KEY")
         return self._api_key
     
-    def get_default_model(self) -> str:
+    @classmethod
+    def has_api_key(cls) -> bool:
+        """Check for the Anthropic API key without constructing a provider"""
+        return os.getenv("ANTHROPIC_API_KEY") is not None
+    
+    def _rate_limit_errors(self):
+        """Retry on Anthropic rate-limit responses"""
+        anthropic = _import_sdk()
+        return (anthropic.RateLimitError,) if anthropic is not None else ()
+    
+    @classmethod
+    def get_default_model(cls) -> str:
         """Get default Anthropic model"""
         return "claude-3-haiku-20240307"
     
     def _initialize_client(self):
         """Initialize Anthropic client with API key"""
         if self.client is None:
+            anthropic = _import_sdk()
             if anthropic is None:
                 raise ImportError("Anthropic package not installed. Please install with: pip install anthropic")
             
@@ -35,7 +55,8 @@ class AnthropicProvider(BaseLLMProvider):
                     "Anthropic API key not found. Please set ANTHROPIC_API_KEY environment variable."
                 )
             
-            self.client = anthropic.AsyncAnthropic(api_key=api_key)
+            self._http_client = anthropic.DefaultAsyncHttpxClient(**self._http_client_options())
+            self.client = anthropic.AsyncAnthropic(api_key=api_key, http_client=self._http_client)
     
     async def generate_response(self, messages: List[Dict], config: LLMConfig) -> str:
         """Generate response using Anthropic API"""
@@ -43,19 +64,27 @@ class AnthropicProvider(BaseLLMProvider):
         
         try:
             # Convert OpenAI format to Anthropic format
-            anthropic_messages = self._convert_messages(messages)
+            params = self._request_params(messages, config)
             
-            response = await self.client.messages.create(
-                model=config.model_name or self.get_default_model(),
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-                messages=anthropic_messages,
-                **(config.additional_params or {})
-            )
+            response = await self._send_with_rate_limit(messages, lambda: self.client.messages.create(**params))
             return response.content[0].text
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
     
+    async def stream_response(self, messages: List[Dict], config: LLMConfig) -> AsyncIterator[str]:
+        """Stream response text from Anthropic API as it is generated"""
+        self._initialize_client()
+        
+        try:
+            params = self._request_params(messages, config)
+            
+            await self.rate_limiter.acquire(estimate_tokens(messages))
+            async with self.client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+    
     async def tool_call(self, messages: List[Dict], tools: List[Dict], config: LLMConfig) -> Dict:
         """Perform tool calling with Anthropic API"""
         self._initialize_client()
@@ -63,15 +92,10 @@ class AnthropicProvider(BaseLLMProvider):
         try:
             # Convert tools to Anthropic format
             anthropic_tools = self._convert_tools(tools)
-            anthropic_messages = self._convert_messages(messages)
+            params = self._request_params(messages, config, tools=anthropic_tools)
             
-            response = await self.client.messages.create(
-                model=config.model_name or self.get_default_model(),
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-                messages=anthropic_messages,
-                tools=anthropic_tools,
-                **(config.additional_params or {})
+            response = await self._send_with_rate_limit(
+                messages, lambda: self.client.messages.create(**params), tools=anthropic_tools
             )
             
             return {
@@ -81,18 +105,44 @@ class AnthropicProvider(BaseLLMProvider):
         except Exception as e:
             raise Exception(f"Anthropic tool call error: {str(e)}")
     
-    def _convert_messages(self, messages: List[Dict]) -> List[Dict]:
-        """Convert OpenAI message format to Anthropic format"""
+    def _request_params(self, messages: List[Dict], config: LLMConfig,
+                        tools: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """Build messages.create keyword arguments, routing system text to `system`"""
+        anthropic_messages, system = self._convert_messages(messages)
+        
+        params = {
+            "model": config.model_name or self.get_default_model(),
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "messages": anthropic_messages
+        }
+        if system:
+            # Mark the system prompt as a cache breakpoint so repeated prompt types reuse it
+            params["system"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        if tools is not None:
+            params["tools"] = tools
+        params.update(config.additional_params or {})
+        return params
+    
+    def _convert_messages(self, messages: List[Dict]) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Convert OpenAI message format to Anthropic format.
+        
+        Anthropic takes the system prompt as a separate `system` parameter, so
+        system messages are split out and returned alongside the remaining
+        messages, which keep only their role and content.
+        """
         anthropic_messages = []
+        system_parts = []
         for msg in messages:
             if msg.get("role") == "system":
-                # Anthropic handles system messages differently
+                system_parts.append(msg["content"])
                 continue
             anthropic_messages.append({
                 "role": msg["role"],
                 "content": msg["content"]
             })
-        return anthropic_messages
+        return anthropic_messages, "\n\n".join(system_parts) or None
     
     def _convert_tools(self, tools: List[Dict]) -> List[Dict]:
         """Convert OpenAI tool format to Anthropic format"""
@@ -106,7 +156,8 @@ class AnthropicProvider(BaseLLMProvider):
                 })
         return anthropic_tools
     
-    def get_available_models(self) -> List[str]:
+    @classmethod
+    def get_available_models(cls) -> List[str]:
         """Get list of available Anthropic models"""
         return [
             "claude-3-opus-20240229",
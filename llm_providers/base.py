@@ -1,26 +1,86 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, AsyncIterator, Awaitable, Callable, Tuple, Type
 from dataclasses import dataclass, field
+from types import MappingProxyType
+import asyncio
+import importlib.util
 import os
+import random
+from .rate_limiter import RateLimiter, estimate_tokens
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     model_name: str
     temperature: float = 0.7
     max_tokens: int = 2048
-    additional_params: Dict[str, Any] = field(default_factory=dict)
+    # Excluded from the hash since mappings are unhashable; still compared for equality
+    additional_params: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}), hash=False)
 
 class BaseLLMProvider(ABC):
     """Base class for all LLM providers"""
     
+    # Requests/tokens per minute allowed by the provider's rate limits
+    RATE_LIMIT_PROFILE: Dict[str, int] = {"requests_per_minute": 60, "tokens_per_minute": 150000}
+    
+    # Attempts made when the API responds with a rate-limit error
+    MAX_RETRIES = 3
+    
+    # Connection pool settings for the SDK's underlying httpx client
+    HTTP_POOL_LIMITS: Dict[str, Any] = {
+        "max_connections": 64,
+        "max_keepalive_connections": 64,
+        "keepalive_expiry": 60
+    }
+    
     def __init__(self):
         self.provider_name = self.__class__.__name__.replace("Provider", "").lower()
+        self.rate_limiter = RateLimiter(**self.RATE_LIMIT_PROFILE)
+        self._http_client = None
+    
+    def _http_client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for the SDK's pooled httpx client (HTTP/2 needs the h2 package)"""
+        import httpx
+        
+        return {
+            "http2": importlib.util.find_spec("h2") is not None,
+            "limits": httpx.Limits(**self.HTTP_POOL_LIMITS)
+        }
+    
+    async def aclose(self):
+        """Close the pooled HTTP client, if one was created"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self.client = None
+    
+    def _rate_limit_errors(self) -> Tuple[Type[BaseException], ...]:
+        """Exception types that signal the provider is rate limiting requests"""
+        return ()
+    
+    async def _send_with_rate_limit(self, messages: List[Dict], send: Callable[[], Awaitable[Any]],
+                                    tools: Optional[List[Dict]] = None) -> Any:
+        """Send a request through the rate limiter, backing off on rate-limit errors"""
+        retry_on = self._rate_limit_errors()
+        tokens = estimate_tokens(messages, tools)
+        
+        for attempt in range(self.MAX_RETRIES):
+            await self.rate_limiter.acquire(tokens)
+            try:
+                return await send()
+            except retry_on:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt + random.random())
     
     @abstractmethod
     async def generate_response(self, messages: List[Dict], config: LLMConfig) -> str:
         """Generate text response from the LLM"""
         pass
     
+    async def stream_response(self, messages: List[Dict], config: LLMConfig) -> AsyncIterator[str]:
+        """Yield the response text as it is generated (default: one chunk once complete)"""
+        yield await self.generate_response(messages, config)
+    
     @abstractmethod
     async def tool_call(self, messages: List[Dict], tools: List[Dict], config: LLMConfig) -> Dict:
         """Perform tool calling with the LLM"""
@@ -31,11 +91,22 @@ class BaseLLMProvider(ABC):
         """Get the API key for this provider from environment variables"""
         pass
     
+    @classmethod
     @abstractmethod
-    def get_default_model(self) -> str:
+    def get_default_model(cls) -> str:
         """Get the default model name for this provider"""
         pass
     
     def validate_api_key(self) -> bool:
         """Validate that the API key is available"""
-        return self.get_api_key() is not None 
\ No newline at end of file
+        return self.get_api_key() is not None
+    
+    @classmethod
+    def has_api_key(cls) -> bool:
+        """
+        Check that an API key is available without keeping a provider instance.
+        
+        The default asks a throwaway instance; providers whose key lookup needs
+        no instance override this to skip the construction.
+        """
+        return cls().validate_api_key() 
\ No newline at end of file
@@ -1,16 +1,25 @@
 from .base import BaseLLMProvider
-from .openai_provider import OpenAIProvider
-from .anthropic_provider import AnthropicProvider
-from typing import Dict, Optional, List
+from importlib import import_module
+from typing import Dict, Optional, List, Union
 
 class LLMProviderFactory:
     def __init__(self):
         self._providers: Dict[str, BaseLLMProvider] = {}
-        self._registered_providers = {
-            "openai": OpenAIProvider,
-            "anthropic": AnthropicProvider
+        # Built-in providers are "module:Class" paths, imported when first needed
+        self._registered_providers: Dict[str, Union[type, str]] = {
+            "openai": ".openai_provider:OpenAIProvider",
+            "anthropic": ".anthropic_provider:AnthropicProvider"
         }
     
+    def _get_provider_class(self, provider_name: str) -> type:
+        """Resolve a registered provider class, importing it on first use"""
+        provider_class = self._registered_providers[provider_name]
+        if isinstance(provider_class, str):
+            module_name, class_name = provider_class.split(":")
+            provider_class = getattr(import_module(module_name, __package__), class_name)
+            self._registered_providers[provider_name] = provider_class
+        return provider_class
+    
     def get_provider(self, provider_name: str) -> BaseLLMProvider:
         """Get or create LLM provider instance with API key validation"""
         if provider_name not in self._providers:
@@ -19,7 +28,7 @@ class LLMProviderFactory:
                 raise ValueError(f"Unknown provider: {provider_name}. Available providers: {available}")
             
             # Create provider instance
-            provider = self._registered_providers[provider_name]()
+            provider = self._get_provider_class(provider_name)()
             
             # Validate API key is available
             if not provider.validate_api_key():
@@ -58,32 +67,36 @@ class LLMProviderFactory:
         """List providers that are currently initialized"""
         return list(self._providers.keys())
     
+    async def aclose(self):
+        """Close the HTTP connection pools held by initialized providers"""
+        for provider in self._providers.values():
+            await provider.aclose()
+    
+    def _has_api_key(self, provider_name: str) -> bool:
+        """Check API key availability, asking the provider class when no instance exists yet"""
+        if provider_name in self._providers:
+            return self._providers[provider_name].validate_api_key()
+        return self._get_provider_class(provider_name).has_api_key()
+    
     def validate_all_providers(self) -> Dict[str, bool]:
         """Check which providers have valid API keys"""
-        validation_status = {}
-        
-        for provider_name, provider_class in self._registered_providers.items():
-            try:
-                provider = provider_class()
-                validation_status[provider_name] = provider.validate_api_key()
-            except Exception as e:
-                validation_status[provider_name] = False
-        
-        return validation_status
+        return {
+            provider_name: self._has_api_key(provider_name)
+            for provider_name in self._registered_providers
+        }
     
     def get_provider_info(self, provider_name: str) -> Dict[str, any]:
         """Get detailed information about a provider"""
         if provider_name not in self._registered_providers:
             raise ValueError(f"Unknown provider: {provider_name}")
         
-        provider_class = self._registered_providers[provider_name]
-        provider = provider_class()
+        provider_class = self._get_provider_class(provider_name)
         
         return {
             "name": provider_name,
             "class": provider_class.__name__,
-            "api_key_available": provider.validate_api_key(),
+            "api_key_available": self._has_api_key(provider_name),
             "env_var": self._get_env_var_name(provider_name),
-            "default_model": provider.get_default_model(),
-            "available_models": provider.get_available_models() if hasattr(provider, 'get_available_models') else []
+            "default_model": provider_class.get_default_model(),
+            "available_models": provider_class.get_available_models() if hasattr(provider_class, 'get_available_models') else []
         } 
\ No newline at end of file
@@ -1,16 +1,23 @@
 from .base import BaseLLMProvider, LLMConfig
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, AsyncIterator
 import os
-try:
-    import openai
-except ImportError:
-    openai = None
-import json
+
+
+def _import_sdk():
+    """Import the OpenAI SDK on first use so loading this module stays cheap"""
+    try:
+        import openai
+    except ImportError:
+        return None
+    return openai
+
 
 class OpenAIProvider(BaseLLMProvider):
+    RATE_LIMIT_PROFILE = {"requests_per_minute": 60, "tokens_per_minute": 150000}
+    
     def __init__(self):
         super().__init__()
-        self.client: Optional[openai.AsyncOpenAI] = None
+        self.client: Optional["openai.AsyncOpenAI"] = None
         self._api_key: Optional[str] = None
     
     def get_api_key(self) -> Optional[str]:
@@ -19,13 +26,25 @@ class OpenAIProvider(BaseLLMProvider):
             self._api_key = os.getenv("OPENAI_API_KEY")
         return self._api_key
     
-    def get_default_model(self) -> str:
+    @classmethod
+    def has_api_key(cls) -> bool:
+        """Check for the OpenAI API key without constructing a provider"""
+        return os.getenv("OPENAI_API_KEY") is not None
+    
+    def _rate_limit_errors(self):
+        """Retry on OpenAI rate-limit responses"""
+        openai = _import_sdk()
+        return (openai.RateLimitError,) if openai is not None else ()
+    
+    @classmethod
+    def get_default_model(cls) -> str:
         """Get default OpenAI model"""
         return "gpt-4o-mini"
     
     def _initialize_client(self):
         """Initialize OpenAI client with API key"""
         if self.client is None:
+            openai = _import_sdk()
             if openai is None:
                 raise ImportError("OpenAI package not installed. Please install with: pip install openai")
             
@@ -35,37 +54,57 @@ class OpenAIProvider(BaseLLMProvider):
                     "OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
                 )
             
-            self.client = openai.AsyncOpenAI(api_key=api_key)
+            self._http_client = openai.DefaultAsyncHttpxClient(**self._http_client_options())
+            self.client = openai.AsyncOpenAI(api_key=api_key, http_client=self._http_client)
     
     async def generate_response(self, messages: List[Dict], config: LLMConfig) -> str:
         """Generate response using OpenAI API"""
         self._initialize_client()
         
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._send_with_rate_limit(messages, lambda: self.client.chat.completions.create(
                 model=config.model_name or self.get_default_model(),
                 messages=messages,
                 temperature=config.temperature,
                 max_tokens=config.max_tokens,
                 **(config.additional_params or {})
-            )
+            ))
             return response.choices[0].message.content
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
     
+    async def stream_response(self, messages: List[Dict], config: LLMConfig) -> AsyncIterator[str]:
+        """Stream response text from OpenAI API as it is generated"""
+        self._initialize_client()
+        
+        try:
+            stream = await self._send_with_rate_limit(messages, lambda: self.client.chat.completions.create(
+                model=config.model_name or self.get_default_model(),
+                messages=messages,
+                temperature=config.temperature,
+                max_tokens=config.max_tokens,
+                stream=True,
+                **(config.additional_params or {})
+            ))
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+    
     async def tool_call(self, messages: List[Dict], tools: List[Dict], config: LLMConfig) -> Dict:
         """Perform tool calling with OpenAI API"""
         self._initialize_client()
         
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._send_with_rate_limit(messages, lambda: self.client.chat.completions.create(
                 model=config.model_name or self.get_default_model(),
                 messages=messages,
                 tools=tools,
                 temperature=config.temperature,
                 max_tokens=config.max_tokens,
                 **(config.additional_params or {})
-            )
+            ), tools=tools)
             
             return {
                 "message": response.choices[0].message,
@@ -74,7 +113,8 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             raise Exception(f"OpenAI tool call error: {str(e)}")
     
-    def get_available_models(self) -> List[str]:
+    @classmethod
+    def get_available_models(cls) -> List[str]:
         """Get list of available OpenAI models"""
         return [
             "gpt-4o",
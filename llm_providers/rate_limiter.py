@@ -0,0 +1,80 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _payload_size(value: Any) -> int:
+    """Serialized size of message content or tool schemas"""
+    if isinstance(value, str):
+        return len(value)
+    if orjson is not None:
+        return len(orjson.dumps(value, default=str))
+    return len(json.dumps(value, default=str, separators=(",", ":")))
+
+
+def estimate_tokens(messages: List[Dict], tools: Optional[List[Dict]] = None) -> int:
+    """Rough token estimate for chat messages and tool definitions (~4 characters per token)"""
+    size = sum(_payload_size(msg.get("content", "")) for msg in messages)
+    if tools:
+        size += _payload_size(tools)
+    return size // 4
+
+
+class RateLimiter:
+    """Sliding-window limiter for requests and tokens per minute"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, window: float = 60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._tokens: Deque[Tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+
+    def _evict(self, now: float):
+        """Drop entries that have left the window"""
+        while self._requests and now - self._requests[0] >= self.window:
+            self._requests.popleft()
+        while self._tokens and now - self._tokens[0][0] >= self.window:
+            self._tokens_in_window -= self._tokens.popleft()[1]
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until a request of the given size fits in the window"""
+        wait = 0.0
+        if len(self._requests) >= self.requests_per_minute:
+            wait = self._requests[0] + self.window - now
+
+        # A single request larger than the budget only waits for an empty window
+        budget = max(self.tokens_per_minute - tokens, 0)
+        if self._tokens_in_window > budget:
+            released = 0
+            for timestamp, used in self._tokens:
+                released += used
+                if self._tokens_in_window - released <= budget:
+                    wait = max(wait, timestamp + self.window - now)
+                    break
+        return wait
+
+    async def acquire(self, tokens: int = 0):
+        """Wait until a request using `tokens` tokens may be sent, then record it"""
+        # Checking and recording do not await, so they run atomically on the event
+        # loop without a lock; waiters sleep concurrently and re-check on waking.
+        # Holding no asyncio primitive also keeps the limiter usable across the
+        # separate asyncio.run() loops of long-lived providers.
+        while True:
+            now = time.monotonic()
+            self._evict(now)
+            wait = self._wait_time(now, tokens)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        
+        self._requests.append(now)
+        self._tokens.append((now, tokens))
+        self._tokens_in_window += tokens
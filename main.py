@@ -12,12 +12,12 @@ Usage:
 """
 
 import os
+import re
 import sys
+import logging
 import argparse
-import json
 import time
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
@@ -27,8 +27,17 @@ from youtube_transcriptor.core.pipeline import TranscriptionPipeline
 from youtube_transcriptor.core.playlist_extractor import PlaylistExtractor
 from youtube_transcriptor.core.transcript_extractor import TranscriptExtractor
 from youtube_transcriptor.core.web_transcript_extractor import WebTranscriptExtractor
-from youtube_transcriptor.utils.helpers import sanitize_filename
+from youtube_transcriptor.utils.helpers import aggregate_segments, sanitize_filename, write_json_file
+from youtube_transcriptor.cache.metadata_cache import cache_lookup, cache_store
 from youtube_transcriptor.config.settings import settings
+from youtube_transcriptor.utils.logging_setup import setup_queue_logging
+
+logger = logging.getLogger("yt.main")
+
+
+# "v" / "list" query parameters, and the path of youtu.be short links
+_QUERY_ID_RE = re.compile(r"[?&](v|list)=([^&#]+)")
+_SHORT_URL_RE = re.compile(r"^https?://youtu\.be/([^?#]*)", re.IGNORECASE)
 
 
 class YouTubeProcessor:
@@ -44,10 +53,11 @@ class YouTubeProcessor:
         
         self.use_web_api = bool(self.transcript_api_token)
         
-        print(f"🔧 Initialized YouTube Processor")
-        print(f"✅ YouTube API: {'SET' if self.youtube_api_key else '❌ NOT SET'}")
-        print(f"✅ Transcript API: {'SET' if self.transcript_api_token else '❌ NOT SET (using fallback)'}")
-        print()
+        logger.info(
+            f"🔧 Initialized YouTube Processor\n"
+            f"✅ YouTube API: {'SET' if self.youtube_api_key else '❌ NOT SET'}\n"
+            f"✅ Transcript API: {'SET' if self.transcript_api_token else '❌ NOT SET (using fallback)'}\n"
+        )
     
     def identify_url_type(self, url: str) -> tuple[str, str]:
         """
@@ -66,31 +76,29 @@ class YouTubeProcessor:
             elif len(url) > 11:  # Assume playlist ID
                 return 'playlist', url
         
-        # Parse URL
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-        
-        # Check for playlist
-        if 'list' in query_params:
-            playlist_id = query_params['list'][0]
-            return 'playlist', playlist_id
+        # Scan query parameters; a playlist wins over a video
+        video_id = None
+        for match in _QUERY_ID_RE.finditer(url):
+            key, value = match.groups()
+            if key == 'list':
+                return 'playlist', value
+            if video_id is None:
+                video_id = value
         
         # Check for video
-        if 'v' in query_params:
-            video_id = query_params['v'][0]
+        if video_id is not None:
             return 'video', video_id
         
         # Check for youtu.be format
-        if parsed.hostname == 'youtu.be':
-            video_id = parsed.path[1:]  # Remove leading slash
-            return 'video', video_id
+        match = _SHORT_URL_RE.match(url)
+        if match:
+            return 'video', match.group(1)
         
         raise ValueError(f"Could not identify URL type: {url}")
     
     def process_playlist(self, playlist_url: str, base_output_dir: str = "data") -> dict:
         """Process a YouTube playlist."""
-        print(f"🎬 Processing Playlist: {playlist_url}")
-        print("-" * 50)
+        logger.info(f"🎬 Processing Playlist: {playlist_url}\n" + "-" * 50)
         
         # Use the existing pipeline
         pipeline = TranscriptionPipeline(
@@ -104,19 +112,19 @@ class YouTubeProcessor:
         
         if results["success"]:
             playlist_data = results["playlist_data"]
-            print(f"✅ SUCCESS!")
-            print(f"📋 Playlist: {playlist_data['title']}")
-            print(f"🎭 Channel: {playlist_data['channel']}")
-            print(f"📊 Videos: {playlist_data['video_count']}")
-            print(f"✅ Transcripts: {results['transcripts_processed']}")
-            print(f"❌ Failed: {results['transcripts_failed']}")
-            print(f"📈 Success Rate: {(results['transcripts_processed']/playlist_data['video_count']*100):.1f}%")
-            print(f"⏱️  Processing Time: {total_time:.2f}s")
-            print(f"📁 Output Directory: {results['output_directory']}")
+            logger.info(
+                f"✅ SUCCESS!\n"
+                f"📋 Playlist: {playlist_data['title']}\n"
+                f"🎭 Channel: {playlist_data['channel']}\n"
+                f"📊 Videos: {playlist_data['video_count']}\n"
+                f"✅ Transcripts: {results['transcripts_processed']}\n"
+                f"❌ Failed: {results['transcripts_failed']}\n"
+                f"📈 Success Rate: {(results['transcripts_processed']/playlist_data['video_count']*100):.1f}%\n"
+                f"⏱️  Processing Time: {total_time:.2f}s\n"
+                f"📁 Output Directory: {results['output_directory']}"
+            )
         else:
-            print(f"❌ FAILED!")
-            for error in results["errors"]:
-                print(f"  • {error}")
+            logger.error("❌ FAILED!\n" + "\n".join(f"  • {error}" for error in results["errors"]))
         
         return results
     
@@ -124,9 +132,7 @@ class YouTubeProcessor:
         """Process a single YouTube video."""
         _, video_id = self.identify_url_type(video_url)
         
-        print(f"🎥 Processing Video: {video_url}")
-        print(f"🆔 Video ID: {video_id}")
-        print("-" * 50)
+        logger.info(f"🎥 Processing Video: {video_url}\n🆔 Video ID: {video_id}\n" + "-" * 50)
         
         start_time = time.time()
         
@@ -154,8 +160,8 @@ class YouTubeProcessor:
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Aggregate transcript text
-            aggregated_text = " ".join(segment.text for segment in transcript.segments if segment.text.strip())
-            aggregated_text = " ".join(aggregated_text.split())  # Clean up whitespace
+            # Aggregate text, word count and segment dicts in a single pass
+            aggregated_text, word_count, segments = aggregate_segments(transcript.segments)
             
             # Create comprehensive video data
             video_data = {
@@ -176,19 +182,11 @@ class YouTubeProcessor:
                     "total_segments": len(transcript.segments),
                     "aggregated_text": aggregated_text,
                     "text_length": len(aggregated_text),
-                    "word_count": len(aggregated_text.split()) if aggregated_text else 0
+                    "word_count": word_count
                 },
                 
                 # Detailed segments
-                "segments": [
-                    {
-                        "start": segment.start,
-                        "duration": segment.duration,
-                        "text": segment.text,
-                        "timestamp": f"{int(segment.start // 60):02d}:{int(segment.start % 60):02d}"
-                    }
-                    for segment in transcript.segments
-                ],
+                "segments": segments,
                 
                 # Metadata
                 "extraction_timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
@@ -199,20 +197,21 @@ class YouTubeProcessor:
             filename = f"{video_title_clean}_{video_id}.json"
             filepath = output_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(video_data, f, indent=2, ensure_ascii=False)
+            write_json_file(filepath, video_data)
             
             total_time = time.time() - start_time
             
-            print(f"✅ SUCCESS!")
-            print(f"📹 Video: {video_info['title']}")
-            print(f"🎭 Channel: {video_info.get('channel_title', 'Unknown')}")
-            print(f"🌍 Language: {transcript.language}")
-            print(f"📊 Segments: {len(transcript.segments)}")
-            print(f"📝 Words: {video_data['transcript']['word_count']:,}")
-            print(f"⏱️  Processing Time: {total_time:.2f}s")
-            print(f"📁 Output Directory: {output_dir}")
-            print(f"📄 File: {filename}")
+            logger.info(
+                f"✅ SUCCESS!\n"
+                f"📹 Video: {video_info['title']}\n"
+                f"🎭 Channel: {video_info.get('channel_title', 'Unknown')}\n"
+                f"🌍 Language: {transcript.language}\n"
+                f"📊 Segments: {len(transcript.segments)}\n"
+                f"📝 Words: {video_data['transcript']['word_count']:,}\n"
+                f"⏱️  Processing Time: {total_time:.2f}s\n"
+                f"📁 Output Directory: {output_dir}\n"
+                f"📄 File: {filename}"
+            )
             
             return {
                 "success": True,
@@ -226,7 +225,7 @@ class YouTubeProcessor:
             }
             
         except Exception as e:
-            print(f"❌ FAILED: {e}")
+            logger.error(f"❌ FAILED: {e}")
             return {
                 "success": False,
                 "error": str(e),
@@ -235,54 +234,72 @@ class YouTubeProcessor:
     
     def _get_video_info(self, video_id: str) -> dict:
         """Get video information using YouTube API."""
+        return self._get_video_info_batch([video_id])[video_id]
+    
+    def _get_video_info_batch(self, video_ids: list[str]) -> dict[str, dict]:
+        """
+        Get video information for several videos, keyed by video ID.
+        
+        IDs are sent in chunks of 50 (the API limit), so N videos cost
+        ceil(N / 50) requests instead of N. Videos missing from the response
+        get basic placeholder info.
+        """
+        info = {}
+        for video_id in video_ids:
+            hit = cache_lookup(f"meta:{video_id}")
+            if hit is not None:
+                info[video_id] = hit
+        missing_ids = [video_id for video_id in video_ids if video_id not in info]
+        
         try:
             # Try to get video info using the web transcript API first
-            if self.use_web_api:
+            if self.use_web_api and missing_ids:
                 web_extractor = WebTranscriptExtractor(self.transcript_api_token)
-                # Make a request to get video info
-                response = web_extractor._make_api_request([video_id])
-                if response and len(response) > 0:
-                    video_data = response[0]
-                    return {
-                        "title": video_data.get('title', f'Video {video_id}'),
-                        "channel_title": video_data.get('author', 'Unknown'),
-                        "description": video_data.get('microformat', {}).get('playerMicroformatRenderer', {}).get('description', {}).get('simpleText', ''),
-                        "view_count": video_data.get('microformat', {}).get('playerMicroformatRenderer', {}).get('viewCount'),
-                        "published_at": None,  # Would need additional API call
-                        "duration_seconds": None,
-                        "like_count": video_data.get('likeCount')
-                    }
-            
-            # Fallback to basic info
-            return {
-                "title": f"Video {video_id}",
-                "channel_title": "Unknown",
-                "description": "",
-                "view_count": None,
-                "published_at": None,
-                "duration_seconds": None,
-                "like_count": None
-            }
+                batch_size = 50
+                
+                for i in range(0, len(missing_ids), batch_size):
+                    # Make a request to get video info
+                    response = web_extractor._make_api_request(missing_ids[i:i + batch_size])
+                    for video_data in response or []:
+                        video_id = video_data.get('id')
+                        if not video_id:
+                            continue
+                        player = video_data.get('microformat', {}).get('playerMicroformatRenderer', {})
+                        info[video_id] = {
+                            "title": video_data.get('title', f'Video {video_id}'),
+                            "channel_title": video_data.get('author', 'Unknown'),
+                            "description": player.get('description', {}).get('simpleText', ''),
+                            "view_count": player.get('viewCount'),
+                            "published_at": None,  # Would need additional API call
+                            "duration_seconds": None,
+                            "like_count": video_data.get('likeCount')
+                        }
+                        cache_store(f"meta:{video_id}", info[video_id])
             
         except Exception as e:
-            print(f"Warning: Could not get video metadata: {e}")
-            return {
-                "title": f"Video {video_id}",
-                "channel_title": "Unknown",
-                "description": "",
-                "view_count": None,
-                "published_at": None,
-                "duration_seconds": None,
-                "like_count": None
-            }
+            logger.warning(f"Warning: Could not get video metadata: {e}")
+        
+        # Fallback to basic info (not cached, so the next run retries)
+        for video_id in video_ids:
+            if video_id not in info:
+                info[video_id] = {
+                    "title": f"Video {video_id}",
+                    "channel_title": "Unknown",
+                    "description": "",
+                    "view_count": None,
+                    "published_at": None,
+                    "duration_seconds": None,
+                    "like_count": None
+                }
+        
+        return info
     
     def process_url(self, url: str, output_dir: str = "data") -> dict:
         """Process any YouTube URL (playlist or video)."""
         try:
             url_type, url_id = self.identify_url_type(url)
             
-            print(f"🎯 Detected: {url_type.upper()} ({url_id})")
-            print()
+            logger.info(f"🎯 Detected: {url_type.upper()} ({url_id})\n")
             
             if url_type == "playlist":
                 return self.process_playlist(url, output_dir)
@@ -292,7 +309,7 @@ class YouTubeProcessor:
                 raise ValueError(f"Unknown URL type: {url_type}")
                 
         except Exception as e:
-            print(f"❌ Error processing URL: {e}")
+            logger.error(f"❌ Error processing URL: {e}")
             return {"success": False, "error": str(e)}
 
 
@@ -325,6 +342,18 @@ Environment Variables:
         help="Output directory for transcript files (default: data)"
     )
     
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk metadata/transcript cache"
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached metadata/transcripts and store fresh results"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -333,9 +362,15 @@ Environment Variables:
     
     args = parser.parse_args()
     
+    if args.no_cache:
+        settings.cache_enabled = False
+    if args.refresh_cache:
+        settings.cache_refresh = True
+    
+    listener = setup_queue_logging("yt", logging.DEBUG if args.verbose else logging.INFO)
+    
     # Print header
-    print("🎬 YouTube Transcriptor")
-    print("=" * 50)
+    logger.info("🎬 YouTube Transcriptor\n" + "=" * 50)
     
     try:
         # Initialize processor
@@ -344,37 +379,37 @@ Environment Variables:
         # Process URL
         results = processor.process_url(args.url, args.output_dir)
         
-        print()
-        print("=" * 50)
+        logger.info("\n" + "=" * 50)
         
         if results["success"]:
-            print("🎉 Processing completed successfully!")
+            logger.info("🎉 Processing completed successfully!")
             
             if "output_directory" in results:
-                print(f"📁 Check your files in: {results['output_directory']}")
+                logger.info(f"📁 Check your files in: {results['output_directory']}")
             
             # Show next steps
-            print()
-            print("💡 What you can do next:")
-            print("1. Browse the generated JSON files")
-            print("2. Search transcripts using: youtube-transcriptor search 'query' --json-file <file>")
-            print("3. Process more playlists or videos")
+            logger.info(
+                "\n💡 What you can do next:\n"
+                "1. Browse the generated JSON files\n"
+                "2. Search transcripts using: youtube-transcriptor search 'query' --json-file <file>\n"
+                "3. Process more playlists or videos"
+            )
             
         else:
-            print("❌ Processing failed!")
+            logger.error("❌ Processing failed!")
             if "error" in results:
-                print(f"Error: {results['error']}")
+                logger.error(f"Error: {results['error']}")
             sys.exit(1)
             
     except KeyboardInterrupt:
-        print("\n⏹️  Operation cancelled by user")
+        logger.warning("\n⏹️  Operation cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
+        # Full traceback only in verbose mode
+        logger.error(f"❌ Fatal error: {e}", exc_info=args.verbose)
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
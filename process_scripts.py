@@ -3,30 +3,33 @@
 Process JSON transcript data using LLM and save results to text files.
 """
 
-import json
 import asyncio
+import logging
 import os
+import sqlite3
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Tuple
 from data_reader import traverse_json_files
-from result_parser import split_llm_result, parse_entities_and_relationships, save_parsed_result
+from result_parser import parse_entities_and_relationships, save_parsed_result
+from youtube_transcriptor.utils.logging_setup import setup_queue_logging
+
+logger = logging.getLogger("yt.process_scripts")
 
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
     load_dotenv()
-    print("✅ Loaded environment variables from .env file")
+    DOTENV_AVAILABLE = True
 except ImportError:
-    print("⚠️  python-dotenv not installed. Make sure OPENAI_API_KEY is set in environment.")
+    DOTENV_AVAILABLE = False
 
 # Try to import workers module
 try:
     from workers import LLMProcess, PromptType
     WORKERS_AVAILABLE = True
-    print("✅ Workers module loaded successfully")
 except ImportError:
     WORKERS_AVAILABLE = False
-    print("⚠️  Workers module not found. LLM processing will be skipped.")
 
 
 def save_result_to_file(result: str, filename: str, output_dir: str = "results") -> str:
@@ -58,11 +61,11 @@ def save_result_to_file(result: str, filename: str, output_dir: str = "results")
             f.write(f"# {'=' * 50}\n\n")
             f.write(result)
         
-        print(f"💾 Result saved to: {output_file}")
+        logger.info(f"💾 Result saved to: {output_file}")
         return str(output_file)
         
     except Exception as e:
-        print(f"❌ Error saving result to file: {e}")
+        logger.error(f"❌ Error saving result to file: {e}")
         return ""
 
 
@@ -97,11 +100,11 @@ def save_transcript_summary(data: dict, output_dir: str = "results") -> str:
         return save_result_to_file(summary, video_title, output_dir)
         
     except Exception as e:
-        print(f"❌ Error creating transcript summary: {e}")
+        logger.error(f"❌ Error creating transcript summary: {e}")
         return ""
 
 
-async def process_with_llm(data: dict, provider_name: str) -> str:
+async def process_with_llm(data: dict, provider_name: str) -> Tuple[str, bool]:
     """
     Process transcript data using LLM.
     
@@ -110,99 +113,212 @@ async def process_with_llm(data: dict, provider_name: str) -> str:
         provider_name: Name of the LLM provider to use
         
     Returns:
-        Processed result as string
+        Tuple of (processed result as string, whether processing succeeded)
     """
     try:
+        # Pass the dict through; process_json_with_prompt serializes it once for the prompt
         transcript_data = data.get("transcript", {})
-        message_data = json.dumps(transcript_data)
         
         result = await LLMProcess.process_json_with_prompt(
-            message_data,
+            transcript_data,
             prompt_type=PromptType.EXTRACT,
             provider_name=provider_name
         )
         
-        return str(result)
+        return str(result), result.success
         
     except Exception as e:
-        print(f"❌ Error processing with LLM: {e}")
-        return f"Error: {e}"
+        logger.error(f"❌ Error processing with LLM: {e}")
+        return f"Error: {e}", False
+
+
+# Files processed concurrently; each one is a long-latency LLM request
+MAX_CONCURRENT = 8
+
+# Video IDs already processed by the LLM, so reruns skip them
+MANIFEST_PATH = "results/.manifest.sqlite3"
+YOUTUBE_ID_LENGTH = 11
+
+
+def _open_manifest(manifest_path: str = MANIFEST_PATH) -> sqlite3.Connection:
+    """Open the processed-videos manifest, creating it if needed."""
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(manifest_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS processed (video_id TEXT PRIMARY KEY, processed_at TEXT NOT NULL)")
+    return conn
+
+
+def _video_id_from_path(path: str) -> Optional[str]:
+    """Video ID from a "<title>_<video_id>.json" transcript file name, if it has one."""
+    stem = Path(path).stem
+    if len(stem) > YOUTUBE_ID_LENGTH and stem[-YOUTUBE_ID_LENGTH - 1] == "_":
+        return stem[-YOUTUBE_ID_LENGTH:]
+    return None
+
+
+def load_processed_ids(manifest_path: str = MANIFEST_PATH) -> set:
+    """Return the set of video IDs already processed by the LLM."""
+    conn = _open_manifest(manifest_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT video_id FROM processed")}
+    finally:
+        conn.close()
+
+
+def mark_processed(video_id: str, manifest_path: str = MANIFEST_PATH):
+    """Record a video ID as processed."""
+    conn = _open_manifest(manifest_path)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO processed (video_id, processed_at) VALUES (?, ?)",
+                (video_id, datetime.now().isoformat())
+            )
+    finally:
+        conn.close()
+
+
+async def process_file(data: dict, available_provider) -> bool:
+    """
+    Process one transcript file and save its results.
+    
+    Args:
+        data: JSON data containing transcript
+        available_provider: LLM provider to use, or None to save a transcript summary
+        
+    Returns:
+        True if an output file was written
+    """
+    try:
+        video_title = data.get('video_title', data.get('_file_name', 'Unknown'))
+        logger.info(f"\n📹 Processing: {video_title}")
+        
+        if available_provider:
+            logger.info(f"✅ Using LLM provider: {available_provider}")
+            
+            # Process with LLM
+            result, succeeded = await process_with_llm(data, available_provider)
+            
+            # Parse LLM result once; the split items come back with the entities and relationships
+            logger.info(f"🔍 Parsing LLM result...")
+            parsed_data = parse_entities_and_relationships(result)
+            
+            logger.info(
+                f"📊 Found {parsed_data['total_items']} items\n"
+                f"🏢 Entities: {parsed_data['entity_count']}\n"
+                f"🔗 Relationships: {parsed_data['relationship_count']}"
+            )
+            
+            # Save raw LLM result to file without blocking other in-flight requests
+            output_file = await asyncio.to_thread(
+                save_result_to_file,
+                result,
+                f"llm_processed_{video_title}",
+                "results/llm_processed"
+            )
+            
+            # Save parsed result to file
+            parsed_output_file = await asyncio.to_thread(
+                save_parsed_result,
+                result,
+                f"parsed_{video_title}",
+                "results/parsed",
+                parsed_data
+            )
+            
+            logger.info(f"📄 Raw result: {output_file}\n📋 Parsed result: {parsed_output_file}")
+            
+            # Only successful calls go in the manifest; failed ones are retried next run
+            video_id = data.get('video_id')
+            if video_id and succeeded and output_file and parsed_output_file:
+                await asyncio.to_thread(mark_processed, video_id)
+            
+        elif WORKERS_AVAILABLE:
+            logger.warning("❌ No LLM providers available. Saving transcript summary instead.")
+            output_file = await asyncio.to_thread(save_transcript_summary, data, "results/transcript_summaries")
+        else:
+            logger.info("📝 Workers module not available. Saving transcript summary.")
+            output_file = await asyncio.to_thread(save_transcript_summary, data, "results/transcript_summaries")
+        
+        if output_file:
+            logger.info(f"✅ Processed and saved: {video_title}")
+            return True
+        
+        logger.error(f"❌ Failed to process: {video_title}")
+        return False
+        
+    except Exception as e:
+        logger.error(f"❌ Error processing data: {e}")
+        return False
 
 
 async def main():
     """Main processing function."""
-    print("🎬 YouTube Transcript Processor")
-    print("=" * 50)
+    logger.info("🎬 YouTube Transcript Processor\n" + "=" * 50)
     
-    processed_count = 0
+    if DOTENV_AVAILABLE:
+        logger.info("✅ Loaded environment variables from .env file")
+    else:
+        logger.warning("⚠️  python-dotenv not installed. Make sure OPENAI_API_KEY is set in environment.")
+    if WORKERS_AVAILABLE:
+        logger.info("✅ Workers module loaded successfully")
+    else:
+        logger.warning("⚠️  Workers module not found. LLM processing will be skipped.")
     
-    for data in traverse_json_files(limit=10, data_path="data"):
-        try:
-            video_title = data.get('video_title', data.get('_file_name', 'Unknown'))
-            print(f"\n📹 Processing: {video_title}")
-            
-            if WORKERS_AVAILABLE:
-                # Check LLM provider availability
-                providers = LLMProcess.get_available_providers()
-                available_provider = None
-                
-                for provider_name, is_available in providers.items():
-                    if is_available:
-                        available_provider = provider_name
-                        break
-                
-                if available_provider:
-                    print(f"✅ Using LLM provider: {available_provider}")
-                    
-                    # Process with LLM
-                    result = await process_with_llm(data, available_provider)
-                    
-                    # Parse LLM result using split_llm_result
-                    print(f"🔍 Parsing LLM result...")
-                    items = split_llm_result(str(result))
-                    parsed_data = parse_entities_and_relationships(str(result))
-                    
-                    print(f"📊 Found {parsed_data['total_items']} items")
-                    print(f"🏢 Entities: {parsed_data['entity_count']}")
-                    print(f"🔗 Relationships: {parsed_data['relationship_count']}")
-                    
-                    # Save raw LLM result to file
-                    output_file = save_result_to_file(
-                        str(result), 
-                        f"llm_processed_{video_title}",
-                        "results/llm_processed"
-                    )
-                    
-                    # Save parsed result to file
-                    parsed_output_file = save_parsed_result(
-                        str(result),
-                        f"parsed_{video_title}",
-                        "results/parsed"
-                    )
-                    
-                    print(f"📄 Raw result: {output_file}")
-                    print(f"📋 Parsed result: {parsed_output_file}")
-                    
-                else:
-                    print("❌ No LLM providers available. Saving transcript summary instead.")
-                    output_file = save_transcript_summary(data, "results/transcript_summaries")
-            else:
-                print("📝 Workers module not available. Saving transcript summary.")
-                output_file = save_transcript_summary(data, "results/transcript_summaries")
-            
-            if output_file:
-                processed_count += 1
-                print(f"✅ Processed and saved: {video_title}")
-            else:
-                print(f"❌ Failed to process: {video_title}")
-                
-        except Exception as e:
-            print(f"❌ Error processing data: {e}")
-            continue
+    available_provider = None
+    if WORKERS_AVAILABLE:
+        # Check LLM provider availability once for all files
+        providers = LLMProcess.get_available_providers()
+        for provider_name, is_available in providers.items():
+            if is_available:
+                available_provider = provider_name
+                break
+    
+    # Only LLM results are recorded; transcript summaries are redone once a provider is available
+    processed_ids = load_processed_ids() if available_provider else set()
+    skipped_count = 0
+    
+    def _is_processed(video_id) -> bool:
+        nonlocal skipped_count
+        if video_id in processed_ids:
+            skipped_count += 1
+            return True
+        return False
+    
+    def _pending_files():
+        # Skip before the limit applies, so it only counts files still to process; the
+        # pipeline names files "<title>_<video_id>.json", letting most skips avoid the read
+        return traverse_json_files(
+            limit=10,
+            data_path="data",
+            skip_path=lambda path: _is_processed(_video_id_from_path(path)),
+            skip=lambda data: _is_processed(data.get('video_id'))
+        )
     
-    print(f"\n🎉 Processing complete! Processed {processed_count} files.")
-    print(f"📁 Check results in the 'results/' directory")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    
+    async def _bounded(data: dict) -> bool:
+        async with semaphore:
+            return await process_file(data, available_provider)
+    
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_bounded(data)) for data in _pending_files()]
+    finally:
+        if WORKERS_AVAILABLE:
+            await LLMProcess.aclose()
+    
+    processed_count = sum(task.result() for task in tasks)
+    
+    if skipped_count:
+        logger.info(f"\n⏭️  Skipped {skipped_count} already processed files")
+    logger.info(f"\n🎉 Processing complete! Processed {processed_count} files.\n"
+                f"📁 Check results in the 'results/' directory")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    listener = setup_queue_logging("yt")
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()
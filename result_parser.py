@@ -3,8 +3,23 @@
 Simple utility to parse LLM processing results.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import re
+try:
+    # Linear-time DFA engine with a re-compatible API
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Pattern for entities: ("entity"<|>NAME<|>TYPE<|>DESCRIPTION)
+_ENTITY_RE = _regex.compile(r'\("entity"[^)]+\)')
+
+# Pattern for relationships: ("relationship"<|>FROM<|>TO<|>DESCRIPTION<|>SCORE)
+_RELATIONSHIP_RE = _regex.compile(r'\("relationship"[^)]+\)')
+
+# Separator between an item's fields
+FIELD_DELIMITER = '<|>'
 
 
 def split_llm_result(result: str, delimiter: str = "\n<|>\n") -> List[str]:
@@ -45,63 +60,89 @@ def split_llm_result_robust(result: str) -> List[str]:
     Returns:
         List of split items (entities and relationships)
     """
+    entities, relationships = _find_items(result)
+    
+    # Combine and return all items
+    return entities + relationships
+
+
+def _find_items(result: str) -> Tuple[List[str], List[str]]:
+    """Find entity and relationship items, already classified."""
     if not result or not isinstance(result, str):
-        return []
+        return [], []
     
     # Clean up the result string
     result = result.replace('\\"', '"').replace("\\'", "'")
     
-    # Find all entities and relationships using regex
-    # Pattern for entities: ("entity"<|>NAME<|>TYPE<|>DESCRIPTION)
-    entity_pattern = r'\("entity"[^)]+\)'
-    
-    # Pattern for relationships: ("relationship"<|>FROM<|>TO<|>DESCRIPTION<|>SCORE)
-    relationship_pattern = r'\("relationship"[^)]+\)'
-    
-    entities = re.findall(entity_pattern, result)
-    relationships = re.findall(relationship_pattern, result)
-    
-    # Combine and return all items
-    all_items = entities + relationships
-    
-    return all_items
+    # Scan once per kind: an unclosed entity runs on to the next ')', and
+    # the relationships inside that span must still be found on their own
+    return _ENTITY_RE.findall(result), _RELATIONSHIP_RE.findall(result)
 
 
 def parse_entities_and_relationships(result: str) -> dict:
     """
     Parse LLM result specifically for entities and relationships.
     
+    Identical results (e.g. parsed for stats and again when saving) are
+    served from an LRU cache; the returned lists are fresh copies.
+    
     Args:
         result: The result string from LLM processing
         
     Returns:
-        Dictionary with 'entities' and 'relationships' lists
+        Dictionary with the split 'items', 'entities' and 'relationships' lists,
+        plus 'entity_info' / 'relationship_info' with each one's extracted fields
     """
-    # Try robust parsing first
-    items = split_llm_result_robust(result)
+    parsed = _parse_cached(result if isinstance(result, str) else "")
+    return {
+        **parsed,
+        'items': list(parsed['items']),
+        'entities': list(parsed['entities']),
+        'relationships': list(parsed['relationships']),
+        'entity_info': [dict(info) for info in parsed['entity_info']],
+        'relationship_info': [dict(info) for info in parsed['relationship_info']]
+    }
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(result: str) -> dict:
+    """Parse a result string; shared by identical inputs, so never mutate the return value."""
+    # Try robust parsing first; the regex scan already classifies each item
+    entities, relationships = _find_items(result)
+    items = entities + relationships
     
     # If robust parsing didn't work, fall back to simple splitting
     if not items:
         items = split_llm_result(result)
-    
-    entities = []
-    relationships = []
-    
-    for item in items:
-        if item.startswith('("entity"'):
-            entities.append(item)
-        elif item.startswith('("relationship"'):
-            relationships.append(item)
+        entities = [item for item in items if item.startswith('("entity"')]
+        relationships = [item for item in items if item.startswith('("relationship"')]
     
     return {
+        'items': items,
         'entities': entities,
         'relationships': relationships,
+        'entity_info': extract_many_entity_info(entities),
+        'relationship_info': extract_many_relationship_info(relationships),
         'total_items': len(items),
         'entity_count': len(entities),
         'relationship_count': len(relationships)
     }
 
 
+def _split_fields(item_str: str) -> List[str]:
+    """Split an item like ("kind"<|>A<|>B) into its <|>-separated fields, the first being the kind."""
+    # Malformed items are rejected before any slicing or splitting
+    if not isinstance(item_str, str) or FIELD_DELIMITER not in item_str:
+        return []
+    
+    # Regex-matched items have exactly one ("...) wrapper, so a single slice removes it
+    if item_str.startswith('("') and item_str.endswith(')') and not item_str.endswith('))'):
+        return item_str[2:-1].split(FIELD_DELIMITER)
+    
+    # Remove outer parentheses and quotes
+    return item_str.strip('()').strip('"').split(FIELD_DELIMITER)
+
+
 def extract_entity_info(entity_str: str) -> dict:
     """
     Extract information from an entity string.
@@ -112,22 +153,14 @@ def extract_entity_info(entity_str: str) -> dict:
     Returns:
         Dictionary with extracted information
     """
-    try:
-        # Remove outer parentheses and quotes
-        cleaned = entity_str.strip('()').strip('"')
-        
-        # Split by <|>
-        parts = cleaned.split('<|>')
-        
-        if len(parts) >= 4:
-            return {
-                'type': 'entity',
-                'name': parts[1].strip(),
-                'category': parts[2].strip(),
-                'description': parts[3].strip()
-            }
-    except:
-        pass
+    parts = _split_fields(entity_str)
+    if len(parts) >= 4:
+        return {
+            'type': 'entity',
+            'name': parts[1].strip(),
+            'category': parts[2].strip(),
+            'description': parts[3].strip()
+        }
     
     return {
         'type': 'entity',
@@ -147,23 +180,15 @@ def extract_relationship_info(relationship_str: str) -> dict:
     Returns:
         Dictionary with extracted information
     """
-    try:
-        # Remove outer parentheses and quotes
-        cleaned = relationship_str.strip('()').strip('"')
-        
-        # Split by <|>
-        parts = cleaned.split('<|>')
-        
-        if len(parts) >= 5:
-            return {
-                'type': 'relationship',
-                'from': parts[1].strip(),
-                'to': parts[2].strip(),
-                'description': parts[3].strip(),
-                'score': parts[4].strip()
-            }
-    except:
-        pass
+    parts = _split_fields(relationship_str)
+    if len(parts) >= 5:
+        return {
+            'type': 'relationship',
+            'from': parts[1].strip(),
+            'to': parts[2].strip(),
+            'description': parts[3].strip(),
+            'score': parts[4].strip()
+        }
     
     return {
         'type': 'relationship',
@@ -174,7 +199,18 @@ def extract_relationship_info(relationship_str: str) -> dict:
     }
 
 
-def save_parsed_result(result: str, filename: str, output_dir: str = "results/parsed") -> str:
+def extract_many_entity_info(entity_strs: List[str]) -> List[dict]:
+    """Extract information from many entity strings in one call."""
+    return [extract_entity_info(entity_str) for entity_str in entity_strs]
+
+
+def extract_many_relationship_info(relationship_strs: List[str]) -> List[dict]:
+    """Extract information from many relationship strings in one call."""
+    return [extract_relationship_info(relationship_str) for relationship_str in relationship_strs]
+
+
+def save_parsed_result(result: str, filename: str, output_dir: str = "results/parsed",
+                       parsed: Optional[dict] = None) -> str:
     """
     Save parsed result to a text file with better formatting.
     
@@ -182,6 +218,7 @@ def save_parsed_result(result: str, filename: str, output_dir: str = "results/pa
         result: The result string from LLM processing
         filename: Base filename for output
         output_dir: Directory to save parsed results
+        parsed: Output of parse_entities_and_relationships(result), if already available
         
     Returns:
         Path to saved file
@@ -193,43 +230,48 @@ def save_parsed_result(result: str, filename: str, output_dir: str = "results/pa
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Parse the result
-    parsed = parse_entities_and_relationships(result)
+    # Parse the result unless the caller already did
+    if parsed is None:
+        parsed = parse_entities_and_relationships(result)
     
     # Create formatted output
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     safe_filename = filename.replace(" ", "_").replace("/", "_").replace("\\", "_")
     output_file = output_path / f"parsed_{safe_filename}_{timestamp}.txt"
     
+    # Build the whole report in memory and write it with a single call
+    parts = [
+        f"# Parsed LLM Result: {filename}\n",
+        f"# Generated at: {now.isoformat()}\n",
+        f"# Total Items: {parsed['total_items']}\n",
+        f"# Entities: {parsed['entity_count']}\n",
+        f"# Relationships: {parsed['relationship_count']}\n",
+        "=" * 60 + "\n\n",
+        
+        # Write entities with extracted info
+        "ENTITIES:\n",
+        "-" * 30 + "\n"
+    ]
+    append = parts.append
+    for i, info in enumerate(parsed['entity_info'], 1):
+        append(f"{i}. {info['name']} ({info['category']})\n"
+               f"   Description: {info['description']}\n\n")
+    
+    # Write relationships with extracted info
+    append("\nRELATIONSHIPS:\n")
+    append("-" * 30 + "\n")
+    for i, info in enumerate(parsed['relationship_info'], 1):
+        append(f"{i}. {info['from']} → {info['to']} (Score: {info['score']})\n"
+               f"   Description: {info['description']}\n\n")
+    
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Parsed LLM Result: {filename}\n")
-            f.write(f"# Generated at: {datetime.now().isoformat()}\n")
-            f.write(f"# Total Items: {parsed['total_items']}\n")
-            f.write(f"# Entities: {parsed['entity_count']}\n")
-            f.write(f"# Relationships: {parsed['relationship_count']}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            # Write entities with extracted info
-            f.write("ENTITIES:\n")
-            f.write("-" * 30 + "\n")
-            for i, entity in enumerate(parsed['entities'], 1):
-                info = extract_entity_info(entity)
-                f.write(f"{i}. {info['name']} ({info['category']})\n")
-                f.write(f"   Description: {info['description']}\n\n")
-            
-            # Write relationships with extracted info
-            f.write("\nRELATIONSHIPS:\n")
-            f.write("-" * 30 + "\n")
-            for i, relationship in enumerate(parsed['relationships'], 1):
-                info = extract_relationship_info(relationship)
-                f.write(f"{i}. {info['from']} → {info['to']} (Score: {info['score']})\n")
-                f.write(f"   Description: {info['description']}\n\n")
+        output_file.write_text("".join(parts), encoding='utf-8')
         
         print(f"💾 Parsed result saved to: {output_file}")
         return str(output_file)
         
-    except Exception as e:
+    except OSError as e:
         print(f"❌ Error saving parsed result: {e}")
         return ""
 
@@ -9,28 +9,106 @@ Usage: poetry run python run_llm_on_transcript.py <video_id>
 import os
 import sys
 import argparse
-import json
 import time
-import asyncio
-import yaml
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-import dotenv
-from youtube_transcriptor.core.pipeline import TranscriptionPipeline
-from youtube_transcriptor.core.playlist_extractor import PlaylistExtractor
-from youtube_transcriptor.core.transcript_extractor import TranscriptExtractor
-from youtube_transcriptor.core.web_transcript_extractor import WebTranscriptExtractor
-from youtube_transcriptor.utils.helpers import sanitize_filename
-from youtube_transcriptor.config.settings import settings
-from workers.llm_process import LLMProcess, PromptType, LLMConfig
+# yaml, dotenv, asyncio, the extractors and the LLM workers are imported where
+# they are first needed, so `--help` and config errors return without loading them
 
-# Load environment variables
-dotenv.load_dotenv()
+# Parsed config.yaml files are pickled here, keyed by path, mtime and size
+CONFIG_CACHE_DIR = Path(".cache/config")
+
+# LLM prompts; filled in per video with str.format_map
+CUSTOM_PROMPT_TEMPLATE = """
+Video Title: {video_title}
+Video Description: {description}
+Transcript: {transcript_text}
+
+{custom_prompt}
+"""
+
+DEFAULT_PROMPT_TEMPLATE = """
+You are an expert technical writer and editor specializing in artificial intelligence and emerging technologies. You excel at transforming complex transcripts into clear, structured, and engaging articles for both technical and non-technical audiences. Your approach is analytical and factual: you rely solely on the given transcript, avoid assumptions, and organize information in a logical, reader-friendly way. Your writing is concise, professional, and geared toward conveying both the details and the significance of the topic.
+
+* **Video Title:** {video_title}
+* **Video Description:** {description}
+* **Transcript:** {transcript_text}
+
+**Instructions:**
+Segment the transcript into three logical sections based strictly on the content:
+
+1. What it is: Explain what the topic, tool, or concept is.
+
+2. How it works: Describe how it functions, operates, or is used.
+
+3. Why it matters: Summarize its significance, impact, or relevance.
+
+For each section, write a concise summary using only information from the transcript to prevent hallucination.
+
+Each summary should be clear, factual, and self-contained.
+
+Avoid introducing any external information or assumptions.
+
+Format your output as follows:
+
+What it is: [Your summary here in bullet points]
+
+How it works: [Your summary here in bullet points]
+
+Why it matters: [Your summary here in bullet points]
+
+Begin only after fully processing the transcript content. Do not summarize—write a detailed, structured article.
+"""
+
+# Combines the per-part analyses of a transcript that was split by _chunk_text
+MERGE_PROMPT_TEMPLATE = """
+The transcript of the video below was too long for a single request, so it was analyzed in {part_count} consecutive, slightly overlapping parts. Combine the partial analyses into one analysis of the whole video.
+
+Video Title: {video_title}
+Video Description: {description}
+
+Keep the format and sections used by the partial analyses. Merge points that repeat across parts, keep topics in the order they appear in the video, and use only information found in the partial analyses.
+
+{partials}
+"""
+
+# Transcripts longer than this many characters (~12k tokens) are analyzed in parts
+MAX_TRANSCRIPT_CHARS = 48000
+CHUNK_OVERLAP_CHARS = 500
+
+
+def _chunk_text(text: str, max_chars: int = MAX_TRANSCRIPT_CHARS,
+                overlap: int = CHUNK_OVERLAP_CHARS):
+    """
+    Split text into overlapping parts of at most max_chars characters.
+    
+    Parts end on a space where possible, and each part repeats the last
+    `overlap` characters of the previous one so no sentence is lost at a cut.
+    
+    Args:
+        text: Text to split
+        max_chars: Maximum length of a part
+        overlap: Number of characters shared by consecutive parts
+        
+    Yields:
+        Consecutive parts of text; text itself when it already fits
+    """
+    start = 0
+    while len(text) - start > max_chars:
+        end = start + max_chars
+        cut = text.rfind(" ", start + overlap + 1, end)
+        if cut == -1:
+            cut = end
+        yield text[start:cut]
+        
+        # Start the next part on a word boundary inside the overlap
+        next_start = text.find(" ", cut - overlap, cut)
+        start = cut - overlap if next_start == -1 else next_start + 1
+    yield text[start:]
 
 
 class ConfigManager:
@@ -42,12 +120,13 @@ class ConfigManager:
     
     def _load_config(self) -> dict:
         """Load and validate YAML configuration."""
+        import yaml
+
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = self._read_yaml()
             
             # Validate required sections
             if 'prompts' not in config:
@@ -70,6 +149,42 @@ class ConfigManager:
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format: {e}")
     
+    def _read_yaml(self) -> dict:
+        """Parse the config file, reusing the pickled parse while the file is unchanged."""
+        import hashlib
+        import pickle
+        import yaml
+        try:
+            from yaml import CSafeLoader as _Loader
+        except ImportError:
+            from yaml import SafeLoader as _Loader
+
+        stat = self.config_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.blake2b(str(self.config_path.resolve()).encode('utf-8'), digest_size=8).hexdigest()
+        cache_file = CONFIG_CACHE_DIR / f"config_{digest}.pkl"
+
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_key, config = pickle.load(f)
+            if cached_key == key:
+                return config
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            pass
+
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=_Loader)
+
+        # A cache that cannot be written only costs the next run a re-parse
+        try:
+            CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+        return config
+    
     def get_custom_prompt(self) -> str:
         """Get the custom prompt from configuration."""
         return self.config['prompts']['custom']
@@ -102,6 +217,11 @@ class YouTubeLLMProcessor:
     
     def __init__(self, config_manager: ConfigManager):
         """Initialize the processor with API keys from environment."""
+        import dotenv
+
+        # Load environment variables
+        dotenv.load_dotenv()
+
         self.config_manager = config_manager
         self.youtube_api_key = os.getenv("YOUTUBE_API_KEY")
         self.transcript_api_token = os.getenv("TRANSCRIPT_API_TOKEN")
@@ -119,6 +239,14 @@ class YouTubeLLMProcessor:
     
     def get_video_info(self, video_id: str) -> dict:
         """Get video information using YouTube API."""
+        from youtube_transcriptor.cache.metadata_cache import cache_lookup, cache_store
+        from youtube_transcriptor.core.web_transcript_extractor import WebTranscriptExtractor
+
+        # Shares main.py's metadata cache entries, so either script warms it for the other
+        hit = cache_lookup(f"meta:{video_id}")
+        if hit is not None:
+            return hit
+
         try:
             # Try to get video info using the web transcript API first
             if self.use_web_api:
@@ -126,7 +254,7 @@ class YouTubeLLMProcessor:
                 response = web_extractor._make_api_request([video_id])
                 if response and len(response) > 0:
                     video_data = response[0]
-                    return {
+                    info = {
                         "title": video_data.get('title', f'Video {video_id}'),
                         "channel_title": video_data.get('author', 'Unknown'),
                         "description": video_data.get('microformat', {}).get('playerMicroformatRenderer', {}).get('description', {}).get('simpleText', ''),
@@ -135,8 +263,10 @@ class YouTubeLLMProcessor:
                         "duration_seconds": None,
                         "like_count": video_data.get('likeCount')
                     }
+                    cache_store(f"meta:{video_id}", info)
+                    return info
             
-            # Fallback to basic info
+            # Fallback to basic info (not cached, so the next run retries)
             return {
                 "title": f"Video {video_id}",
                 "channel_title": "Unknown",
@@ -161,9 +291,23 @@ class YouTubeLLMProcessor:
     
     def extract_transcript(self, video_id: str) -> dict:
         """Extract transcript for a single video."""
+        from youtube_transcriptor.cache.metadata_cache import cache_lookup, cache_store
+
         print(f"🎥 Processing Video ID: {video_id}")
         print("-" * 50)
         
+        # Re-runs on the same video (e.g. while tuning the prompt) skip fetching and aggregation
+        cached_video_data = cache_lookup(f"video_data:{video_id}")
+        if cached_video_data is not None:
+            print(f"✅ Using cached transcript from {cached_video_data['extraction_timestamp']}")
+            print(f"📹 Video: {cached_video_data['video_title']}")
+            print(f"📝 Words: {cached_video_data['transcript']['word_count']:,}")
+            print()
+            return cached_video_data
+        
+        from youtube_transcriptor.core.transcript_extractor import TranscriptExtractor
+        from youtube_transcriptor.utils.helpers import normalize_text
+        
         start_time = time.time()
         
         try:
@@ -178,8 +322,8 @@ class YouTubeLLMProcessor:
                 raise Exception("Failed to extract transcript")
             
             # Aggregate transcript text
-            aggregated_text = " ".join(segment.text for segment in transcript.segments if segment.text.strip())
-            aggregated_text = " ".join(aggregated_text.split())  # Clean up whitespace
+            # One precompiled-regex pass collapses whitespace; empty segments vanish with it
+            aggregated_text = normalize_text(" ".join([segment.text for segment in transcript.segments]))
             
             # Create comprehensive video data
             video_data = {
@@ -200,7 +344,7 @@ class YouTubeLLMProcessor:
                     "total_segments": len(transcript.segments),
                     "aggregated_text": aggregated_text,
                     "text_length": len(aggregated_text),
-                    "word_count": len(aggregated_text.split()) if aggregated_text else 0
+                    "word_count": aggregated_text.count(" ") + 1 if aggregated_text else 0
                 },
                 
                 # Metadata
@@ -208,6 +352,8 @@ class YouTubeLLMProcessor:
                 "processing_type": "single_video"
             }
             
+            cache_store(f"video_data:{video_id}", video_data)
+            
             total_time = time.time() - start_time
             
             print(f"✅ Transcript extracted successfully!")
@@ -227,6 +373,9 @@ class YouTubeLLMProcessor:
     
     def save_results(self, video_data: dict, llm_result: str):
         """Save transcript JSON and LLM analysis to files."""
+        import yaml
+        from youtube_transcriptor.utils.helpers import sanitize_filename, write_json_file
+
         try:
             # Create results directory
             results_dir = Path("results")
@@ -240,8 +389,7 @@ class YouTubeLLMProcessor:
             
             # Save transcript JSON
             json_file = video_dir / "transcript.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(video_data, f, indent=2, ensure_ascii=False)
+            write_json_file(json_file, video_data)
             
             # Save LLM analysis
             txt_file = video_dir / "analysis.txt"
@@ -265,6 +413,9 @@ class YouTubeLLMProcessor:
     async def process_with_llm(self, video_data: dict, provider: str = "openai", 
                               model: str = "gpt-4o-mini") -> str:
         """Process the transcript with LLM analysis."""
+        import asyncio
+        from workers.llm_process import LLMProcess, PromptType, LLMConfig
+
         print(f"🤖 Processing with LLM ({provider}/{model})")
         print("-" * 50)
         
@@ -279,47 +430,15 @@ class YouTubeLLMProcessor:
         custom_prompt = self.config_manager.get_custom_prompt()
         
         # Use custom prompt with video context or default structured prompt
-        if custom_prompt:
-            prompt = f"""
-Video Title: {video_title}
-Video Description: {description}
-Transcript: {transcript_text}
-
-{custom_prompt}
-"""
-        else:
-            prompt = f"""
-You are an expert technical writer and editor specializing in artificial intelligence and emerging technologies. You excel at transforming complex transcripts into clear, structured, and engaging articles for both technical and non-technical audiences. Your approach is analytical and factual: you rely solely on the given transcript, avoid assumptions, and organize information in a logical, reader-friendly way. Your writing is concise, professional, and geared toward conveying both the details and the significance of the topic.
-
-* **Video Title:** {video_title}
-* **Video Description:** {description}
-* **Transcript:** {transcript_text}
-
-**Instructions:**
-Segment the transcript into three logical sections based strictly on the content:
-
-1. What it is: Explain what the topic, tool, or concept is.
-
-2. How it works: Describe how it functions, operates, or is used.
-
-3. Why it matters: Summarize its significance, impact, or relevance.
-
-For each section, write a concise summary using only information from the transcript to prevent hallucination.
-
-Each summary should be clear, factual, and self-contained.
-
-Avoid introducing any external information or assumptions.
-
-Format your output as follows:
-
-What it is: [Your summary here in bullet points]
-
-How it works: [Your summary here in bullet points]
-
-Why it matters: [Your summary here in bullet points]
-
-Begin only after fully processing the transcript content. Do not summarize—write a detailed, structured article.
-"""
+        template = CUSTOM_PROMPT_TEMPLATE if custom_prompt else DEFAULT_PROMPT_TEMPLATE
+        
+        def build_prompt(text: str) -> str:
+            return template.format_map({
+                "video_title": video_title,
+                "description": description,
+                "transcript_text": text,
+                "custom_prompt": custom_prompt
+            })
         
         # Create LLM configuration
         config = LLMConfig(
@@ -328,47 +447,93 @@ Begin only after fully processing the transcript content. Do not summarize—wri
             max_tokens=16384
         )
         
-        # Process with LLM
-        result = await LLMProcess.process_text_with_prompt(
-            text_data=prompt,
-            prompt_type=PromptType.CUSTOM,
-            custom_prompt=prompt,
-            provider_name=provider,
-            config=config
-        )
+        async def complete(prompt: str) -> str:
+            result = await LLMProcess.process_text_with_prompt(
+                text_data=prompt,
+                prompt_type=PromptType.CUSTOM,
+                custom_prompt=prompt,
+                provider_name=provider,
+                config=config
+            )
+            if not result.success:
+                raise Exception(f"LLM processing failed: {result.error}")
+            return result.result
+        
+        # Process with LLM; long transcripts are analyzed in parts and then merged
+        chunks = list(_chunk_text(transcript_text))
+        if len(chunks) == 1:
+            llm_result = await complete(build_prompt(transcript_text))
+        else:
+            print(f"✂️  Transcript split into {len(chunks)} parts")
+            partials = await asyncio.gather(*[complete(build_prompt(chunk)) for chunk in chunks])
+            llm_result = await complete(MERGE_PROMPT_TEMPLATE.format_map({
+                "part_count": len(chunks),
+                "video_title": video_title,
+                "description": description,
+                "partials": "\n\n".join(
+                    f"--- PART {index} ---\n{partial}" for index, partial in enumerate(partials, 1)
+                )
+            }))
         
         total_time = time.time() - start_time
         
-        if result.success:
-            print(f"✅ LLM processing completed!")
-            print(f"⏱️  Processing Time: {total_time:.2f}s")
-            print()
-            return result.result
-        else:
-            raise Exception(f"LLM processing failed: {result.error}")
+        print(f"✅ LLM processing completed!")
+        print(f"⏱️  Processing Time: {total_time:.2f}s")
+        print()
+        return llm_result
     
     async def run(self, video_id: str, provider: str = "openai", 
                   model: str = "gpt-4o-mini") -> str:
         """Main execution flow: extract transcript and process with LLM."""
+        import asyncio
+
         try:
             # Validate video ID against config
             if not self.config_manager.is_valid_id(video_id):
                 raise ValueError(f"Video/Playlist ID '{video_id}' is not configured in config.yaml")
             
-            # Step 1: Extract transcript
-            video_data = self.extract_transcript(video_id)
+            # Step 1: Extract transcript (blocking HTTP, kept off the event loop)
+            video_data = await asyncio.to_thread(self.extract_transcript, video_id)
             
             # Step 2: Process with LLM
             llm_result = await self.process_with_llm(video_data, provider, model)
             
             # Step 3: Save results
-            self.save_results(video_data, llm_result)
+            await asyncio.to_thread(self.save_results, video_data, llm_result)
             
             return llm_result
             
         except Exception as e:
             print(f"❌ Processing failed: {e}")
             raise
+    
+    async def run_many(self, ids: list, provider: str = "openai",
+                       model: str = "gpt-4o-mini", concurrency: int = 8) -> list:
+        """
+        Run several videos through the pipeline concurrently.
+        
+        Args:
+            ids: Video/playlist IDs to process
+            provider: LLM provider name
+            model: LLM model name
+            concurrency: Maximum number of IDs in flight at once
+            
+        Returns:
+            One entry per ID, in order: the LLM result, or the exception that stopped it
+        """
+        import asyncio
+        from workers.llm_process import LLMProcess
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(video_id: str) -> str:
+            async with semaphore:
+                return await self.run(video_id, provider, model)
+
+        try:
+            return await asyncio.gather(*[_one(video_id) for video_id in ids], return_exceptions=True)
+        finally:
+            await LLMProcess.aclose()
 
 
 def main():
@@ -395,8 +560,28 @@ Environment Variables:
         help="Path to YAML configuration file (default: config.yaml)"
     )
     
-    args = parser.parse_args()
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk metadata/transcript cache"
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached metadata/transcripts and store fresh results"
+    )
     
+    args = parser.parse_args()
+
+    import asyncio
+    from youtube_transcriptor.config.settings import settings
+
+    if args.no_cache:
+        settings.cache_enabled = False
+    if args.refresh_cache:
+        settings.cache_refresh = True
+
     # Print header
     print("🎬 YouTube Transcript LLM Processor")
     print("=" * 50)
@@ -409,12 +594,10 @@ Environment Variables:
         video_id = config_manager.config['videos'].get('id', '')
         playlist_id = config_manager.config['playlists'].get('id', '')
         
-        if not video_id and not playlist_id:
+        target_ids = [target_id for target_id in (video_id, playlist_id) if target_id]
+        if not target_ids:
             raise ValueError("No video or playlist ID configured in config.yaml")
         
-        # Use video ID if available, otherwise playlist ID
-        target_id = video_id if video_id else playlist_id
-        
         # Get LLM settings from config
         provider = config_manager.get_llm_provider()
         model = config_manager.get_llm_model()
@@ -422,9 +605,9 @@ Environment Variables:
         # Initialize processor
         processor = YouTubeLLMProcessor(config_manager)
         
-        # Run processing
-        result = asyncio.run(processor.run(
-            video_id=target_id,
+        # Run processing for every configured ID concurrently
+        results = asyncio.run(processor.run_many(
+            target_ids,
             provider=provider,
             model=model
         ))
@@ -432,7 +615,18 @@ Environment Variables:
         print("=" * 50)
         print("📋 ANALYSIS RESULTS")
         print("=" * 50)
-        print(result)
+        failed = 0
+        for target_id, result in zip(target_ids, results):
+            if len(target_ids) > 1:
+                print(f"--- {target_id} ---")
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"❌ FAILED: {result}")
+            else:
+                print(result)
+        
+        if failed:
+            sys.exit(1)
         
     except KeyboardInterrupt:
         print("\n⏹️  Operation cancelled by user")
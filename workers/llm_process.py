@@ -5,11 +5,21 @@ A worker class that uses the LLM providers system to process JSON input
 with custom prompts for various analysis tasks.
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Optional, Union
+import re
+import string
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import LLM providers system
 from llm_providers import LLMProviderFactory, LLMConfig, BaseLLMProvider
@@ -17,9 +27,99 @@ from llm_providers import LLMProviderFactory, LLMConfig, BaseLLMProvider
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _serialize_json(json_data: Any) -> str:
+    """Format data as indented JSON for a prompt, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which json.dumps still handles
+    return json.dumps(json_data, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a str.format template once into (literal text, field name) pieces"""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _join_pieces(pieces: Tuple[Tuple[str, Optional[str]], ...], values: Dict[str, str]) -> str:
+    """
+    Join pre-split template pieces, substituting each field's value.
+    
+    Equivalent to str.format for templates without format specs or
+    conversions, which covers PLACEHOLDER_PROMPTS, but skips re-parsing
+    the template on every call.
+    """
+    return "".join([
+        literal + values[field_name] if field_name is not None else literal
+        for literal, field_name in pieces
+    ])
+
+
+@lru_cache(maxsize=64)
+def _template_splitter(template: str) -> Callable[[Dict[str, str]], Tuple[str, str]]:
+    """
+    Build a function that fills a template and splits it at {json_data}.
+    
+    Templates whose only field is {json_data} (all of PLACEHOLDER_PROMPTS
+    except CUSTOM-style ones) get a specialized function that returns the
+    pre-joined static prefix and appends the pre-joined suffix to the data.
+    """
+    pieces = _compile_template(template)
+    for index, (literal, field_name) in enumerate(pieces):
+        if field_name == "json_data":
+            before, after = pieces[:index], pieces[index + 1:]
+            if all(name is None for _, name in before + after):
+                head = "".join(text for text, _ in before) + literal
+                tail = "".join(text for text, _ in after)
+                return lambda values: (head, values["json_data"] + tail)
+            return lambda values: (
+                _join_pieces(before, values) + literal,
+                values["json_data"] + _join_pieces(after, values)
+            )
+    return lambda values: ("", _join_pieces(pieces, values))
+
+
+def _split_template(template: str, **values: str) -> Tuple[str, str]:
+    """
+    Fill a template, split into the text before {json_data} and the rest.
+    
+    Everything before the data is the same on every call for a given
+    prompt type, so sending it as the system message gives providers a
+    stable prefix to cache. The combined text is unchanged.
+    
+    Returns:
+        Tuple of (static prefix, data and everything after it)
+    """
+    return _template_splitter(template)(values)
+
+
+# Prepended to the static prompt text when batch_process packs several items into one request
+BATCH_ITEMS_INSTRUCTIONS = """The data below contains several separate items, each starting with a "### ITEM <n> ###" line.
+Handle each item independently, exactly as the instructions describe for a single item, and never mix content between items.
+Start each item's output with the line "### ITEM <n> ###" and nothing else, in the same order as the input."""
+
+_BATCH_ITEM_PATTERN = re.compile(r"^#{1,3}\s*ITEM\s+(\d+)\s*#*\s*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=64)
+def _system_message(base_content: str, static_prefix: str) -> Dict[str, str]:
+    """System message with a prompt's static text appended; shared between calls, never mutated"""
+    return {"role": "system", "content": base_content + "\n\n" + static_prefix.lstrip("\n")}
+
 
-class PromptType(Enum):
-    """Enum for different types of prompts"""
+class PromptType(str, Enum):
+    """
+    Enum for different types of prompts.
+    
+    Members are also str instances, so they hash like their string value;
+    PLACEHOLDER_PROMPTS lookups skip Enum.__hash__ and also accept the
+    plain value ("extract").
+    """
     ANALYZE = "analyze"
     CLASSIFY = "classify"
     EXTRACT = "extract"
@@ -29,7 +129,7 @@ class PromptType(Enum):
     TRADING = "trading"      # Example: Trading signals prompt
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of LLM processing"""
     success: bool
@@ -50,6 +150,38 @@ class LLMProcess:
     # Class-level factory instance
     _factory: Optional[LLMProviderFactory] = None
     
+    # Keep a reference to each input dict on its ProcessingResult. Off by default so
+    # batch results do not pin every (possibly large) input in memory; results from
+    # batch_process are index-aligned with the inputs and batch_process_iter yields indices
+    STORE_INPUT_DATA = False
+    
+    # Provider availability from the last probe, reused for PROVIDER_STATUS_TTL seconds
+    PROVIDER_STATUS_TTL = 60.0
+    _provider_status: Tuple[float, Dict[str, bool]] = (0.0, {})
+    
+    # Concurrent requests scripts should keep in flight per provider
+    MAX_CONCURRENCY = {
+        "openai": 10,
+        "anthropic": 5
+    }
+    
+    # Exact-match cache of deterministic (temperature 0) responses, in LRU order
+    RESPONSE_CACHE_SIZE = 1024
+    RESPONSE_CACHE_TTL: Optional[float] = None  # Seconds; None keeps entries until evicted
+    _response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    cache_hits = 0
+    cache_misses = 0
+    
+    # Shared system messages; providers only read message dicts, so they are not copied per call
+    _SYSTEM_MSG_JSON = {
+        "role": "system",
+        "content": "You are an expert AI assistant specialized in data analysis and processing. Provide accurate, structured, and actionable responses."
+    }
+    _SYSTEM_MSG_TEXT = {
+        "role": "system",
+        "content": "You are an expert AI assistant specialized in text analysis and processing. Provide accurate, structured, and actionable responses."
+    }
+    
     # Default configuration
     DEFAULT_CONFIG = LLMConfig(
         model_name="gpt-4o-mini",  # Fast and cost-effective
@@ -219,6 +351,27 @@ Format your response as a professional trading analysis report.
             cls._factory = LLMProviderFactory()
         return cls._factory
     
+    @classmethod
+    async def aclose(cls):
+        """Close the pooled HTTP connections shared by all LLMProcess calls"""
+        if cls._factory is not None:
+            await cls._factory.aclose()
+    
+    @classmethod
+    def _kept_input(cls, input_data: Any) -> Optional[Dict[str, Any]]:
+        """The value for ProcessingResult.input_data: the input dict if STORE_INPUT_DATA is set"""
+        return input_data if cls.STORE_INPUT_DATA and isinstance(input_data, dict) else None
+    
+    @classmethod
+    def _provider_availability(cls) -> Dict[str, bool]:
+        """Provider availability, probed at most once per PROVIDER_STATUS_TTL"""
+        checked_at, status = cls._provider_status
+        now = time.monotonic()
+        if not status or now - checked_at >= cls.PROVIDER_STATUS_TTL:
+            status = cls.get_factory().validate_all_providers()
+            cls._provider_status = (now, status)
+        return status
+    
     @classmethod
     def get_provider(cls, provider_name: str = "openai") -> BaseLLMProvider:
         """
@@ -239,7 +392,7 @@ Format your response as a professional trading analysis report.
             return factory.get_provider(provider_name)
         except ValueError as e:
             # Try fallback provider
-            available_providers = factory.validate_all_providers()
+            available_providers = cls._provider_availability()
             for provider, is_available in available_providers.items():
                 if is_available and provider != provider_name:
                     logger.warning(f"Primary provider '{provider_name}' not available, using '{provider}' as fallback")
@@ -248,6 +401,117 @@ Format your response as a professional trading analysis report.
             # No providers available
             raise ValueError(f"No LLM providers available. Available providers: {list(available_providers.keys())}. Error: {e}")
     
+    @staticmethod
+    def _cache_key(provider_name: str, config: LLMConfig, messages: List[Dict[str, str]]) -> str:
+        """
+        Hash everything that determines a response into a cache key.
+        
+        Message text is compared with whitespace runs collapsed, so inputs
+        that differ only in spacing or line breaks share a cache entry.
+        """
+        request = {
+            "p": provider_name,
+            "m": config.model_name,
+            "t": config.temperature,
+            "mx": config.max_tokens,
+            "extra": dict(config.additional_params),
+            "msgs": [
+                {**message, "content": " ".join(message["content"].split())}
+                if isinstance(message.get("content"), str) else message
+                for message in messages
+            ]
+        }
+        if orjson is not None:
+            payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        else:
+            payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+    
+    @classmethod
+    async def _generate(cls, provider: BaseLLMProvider, messages: List[Dict[str, str]],
+                        config: LLMConfig) -> str:
+        """
+        Generate a response, reusing the response to an equivalent earlier request.
+        
+        Only temperature-0 requests are cached, since sampled responses are
+        expected to differ between calls.
+        """
+        if config.temperature != 0:
+            return await provider.generate_response(messages, config)
+        
+        key = cls._cache_key(provider.provider_name, config, messages)
+        response = cls._cache_get(key)
+        if response is None:
+            response = await provider.generate_response(messages, config)
+            cls._cache_put(key, response)
+        return response
+    
+    @classmethod
+    def _cache_get(cls, key: str) -> Optional[str]:
+        """Return a live cached response and count the lookup as a hit or miss"""
+        entry = cls._response_cache.get(key)
+        if entry is not None:
+            stored_at, response = entry
+            if cls.RESPONSE_CACHE_TTL is None or time.monotonic() - stored_at < cls.RESPONSE_CACHE_TTL:
+                cls._response_cache.move_to_end(key)
+                cls.cache_hits += 1
+                return response
+            del cls._response_cache[key]
+        
+        cls.cache_misses += 1
+        return None
+    
+    @classmethod
+    def _cache_put(cls, key: str, response: str):
+        """Store a response, evicting the least recently used entry when full"""
+        cls._response_cache[key] = (time.monotonic(), response)
+        if len(cls._response_cache) > cls.RESPONSE_CACHE_SIZE:
+            cls._response_cache.popitem(last=False)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached responses and reset the hit/miss counters"""
+        cls._response_cache.clear()
+        cls.cache_hits = 0
+        cls.cache_misses = 0
+    
+    @classmethod
+    def _messages(cls, system_message: Dict[str, str], static_prefix: str,
+                  user_content: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a prompt, with static_prefix ending the system message"""
+        if static_prefix:
+            system_message = _system_message(system_message["content"], static_prefix)
+        return [system_message, {"role": "user", "content": user_content}]
+    
+    @classmethod
+    def _json_messages(cls, static_prefix: str, user_content: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a JSON prompt"""
+        return cls._messages(cls._SYSTEM_MSG_JSON, static_prefix, user_content)
+    
+    @classmethod
+    def _json_prompt_messages(
+        cls,
+        json_str: str,
+        prompt_type: PromptType,
+        custom_prompt: Optional[str],
+        custom_instructions: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Fill the prompt for serialized JSON data and build the chat messages"""
+        if custom_prompt:
+            # Use custom prompt directly
+            return cls._json_messages("", custom_prompt.format(
+                json_data=json_str,
+                custom_instructions=custom_instructions or ""
+            ))
+        
+        # Use predefined prompt template; its static text goes in the system message
+        static_prefix, formatted_prompt = _split_template(
+            cls.PLACEHOLDER_PROMPTS[prompt_type],
+            json_data=json_str,
+            custom_instructions=custom_instructions or ""
+        )
+        return cls._json_messages(static_prefix, formatted_prompt)
+    
     @classmethod
     async def process_json_with_prompt(
         cls,
@@ -256,7 +520,8 @@ Format your response as a professional trading analysis report.
         custom_prompt: Optional[str] = None,
         custom_instructions: Optional[str] = None,
         provider_name: str = "openai",
-        config: Optional[LLMConfig] = None
+        config: Optional[LLMConfig] = None,
+        preformatted: bool = False
     ) -> ProcessingResult:
         """
         Main method to process JSON data with custom prompts.
@@ -268,77 +533,79 @@ Format your response as a professional trading analysis report.
             custom_instructions: Custom instructions for CUSTOM prompt type
             provider_name: LLM provider to use
             config: LLM configuration (uses default if None)
+            preformatted: Put a JSON string into the prompt verbatim instead of
+                          re-serializing it (it is still validated); the
+                          result's input_data is then always None
             
         Returns:
             ProcessingResult: Result of the processing
         """
+        return await cls._process_json_with_prompt_impl(
+            None, json_data, prompt_type, custom_prompt, custom_instructions,
+            provider_name, config, preformatted
+        )
+    
+    @classmethod
+    async def _process_json_with_prompt_impl(
+        cls,
+        provider: Optional[BaseLLMProvider],
+        json_data: Union[Dict[str, Any], str],
+        prompt_type: PromptType,
+        custom_prompt: Optional[str],
+        custom_instructions: Optional[str],
+        provider_name: str,
+        config: Optional[LLMConfig],
+        preformatted: bool = False
+    ) -> ProcessingResult:
+        """process_json_with_prompt, optionally with a provider already resolved by the caller"""
         try:
+            # Reject a CUSTOM call without instructions before any parsing or provider setup
+            if not custom_prompt and prompt_type == PromptType.CUSTOM and not custom_instructions:
+                return ProcessingResult(
+                    success=False,
+                    error="Custom instructions required for CUSTOM prompt type",
+                    input_data=cls._kept_input(json_data)
+                )
+            
             # Prepare JSON data
+            json_str = None
             if isinstance(json_data, str):
                 try:
-                    json_data = json.loads(json_data)
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    parsed = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
                 except json.JSONDecodeError as e:
                     return ProcessingResult(
                         success=False,
                         error=f"Invalid JSON string: {e}",
                         input_data=None
                     )
+                if preformatted:
+                    json_str, json_data = json_data, None
+                else:
+                    json_data = parsed
             
             # Format JSON for prompt
-            json_str = json.dumps(json_data, indent=2, ensure_ascii=False)
+            if json_str is None:
+                json_str = _serialize_json(json_data)
             
-            # Get provider
-            provider = cls.get_provider(provider_name)
+            # Get provider unless the caller already resolved it
+            if provider is None:
+                provider = cls.get_provider(provider_name)
             
             # Use provided config or default
             if config is None:
                 config = cls.DEFAULT_CONFIG
             
-            # Prepare prompt
-            if custom_prompt:
-                # Use custom prompt directly
-                prompt_template = custom_prompt
-                formatted_prompt = prompt_template.format(
-                    json_data=json_str,
-                    custom_instructions=custom_instructions or ""
-                )
-            else:
-                # Use predefined prompt template
-                prompt_template = cls.PLACEHOLDER_PROMPTS[prompt_type]
-                
-                if prompt_type == PromptType.CUSTOM:
-                    if not custom_instructions:
-                        return ProcessingResult(
-                            success=False,
-                            error="Custom instructions required for CUSTOM prompt type",
-                            input_data=json_data if isinstance(json_data, dict) else None
-                        )
-                    formatted_prompt = prompt_template.format(
-                        json_data=json_str,
-                        custom_instructions=custom_instructions
-                    )
-                else:
-                    formatted_prompt = prompt_template.format(json_data=json_str)
-            
-            # Prepare messages
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are an expert AI assistant specialized in data analysis and processing. Provide accurate, structured, and actionable responses."
-                },
-                {
-                    "role": "user",
-                    "content": formatted_prompt
-                }
-            ]
+            # Prepare prompt and messages
+            messages = cls._json_prompt_messages(json_str, prompt_type, custom_prompt, custom_instructions)
             
             # Generate response
-            response = await provider.generate_response(messages, config)
+            response = await cls._generate(provider, messages, config)
             
             return ProcessingResult(
                 success=True,
                 result=response,
-                input_data=json_data if isinstance(json_data, dict) else None,
+                input_data=cls._kept_input(json_data),
                 prompt_type=prompt_type.value,
                 model_used=config.model_name
             )
@@ -348,10 +615,66 @@ Format your response as a professional trading analysis report.
             return ProcessingResult(
                 success=False,
                 error=str(e),
-                input_data=json_data if isinstance(json_data, dict) else None,
+                input_data=cls._kept_input(json_data),
                 prompt_type=prompt_type.value if prompt_type else None
             )
     
+    @classmethod
+    async def process_json_with_prompt_stream(
+        cls,
+        json_data: Union[Dict[str, Any], str],
+        prompt_type: PromptType = PromptType.ANALYZE,
+        custom_prompt: Optional[str] = None,
+        custom_instructions: Optional[str] = None,
+        provider_name: str = "openai",
+        config: Optional[LLMConfig] = None
+    ) -> AsyncIterator[str]:
+        """
+        Process JSON data like process_json_with_prompt, yielding the response as it is generated.
+        
+        A cached response is yielded as a single chunk, and a completed
+        stream is added to the response cache.
+        
+        Args:
+            json_data: JSON data as dict or string
+            prompt_type: Type of prompt to use
+            custom_prompt: Custom prompt template (overrides prompt_type)
+            custom_instructions: Custom instructions for CUSTOM prompt type
+            provider_name: LLM provider to use
+            config: LLM configuration (uses default if None)
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            ValueError: If the JSON string is invalid or CUSTOM instructions are missing
+        """
+        if isinstance(json_data, str):
+            json_data = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
+        if not custom_prompt and prompt_type == PromptType.CUSTOM and not custom_instructions:
+            raise ValueError("Custom instructions required for CUSTOM prompt type")
+        
+        provider = cls.get_provider(provider_name)
+        if config is None:
+            config = cls.DEFAULT_CONFIG
+        messages = cls._json_prompt_messages(_serialize_json(json_data), prompt_type, custom_prompt, custom_instructions)
+        
+        key = None
+        if config.temperature == 0:
+            key = cls._cache_key(provider.provider_name, config, messages)
+            cached = cls._cache_get(key)
+            if cached is not None:
+                yield cached
+                return
+        
+        chunks = []
+        async for chunk in provider.stream_response(messages, config):
+            chunks.append(chunk)
+            yield chunk
+        
+        if key is not None:
+            cls._cache_put(key, "".join(chunks))
+    
     @classmethod
     async def process_text_with_prompt(
         cls,
@@ -385,6 +708,14 @@ Format your response as a professional trading analysis report.
                     input_data=None
                 )
             
+            # Reject a CUSTOM call without instructions before provider setup
+            if not custom_prompt and prompt_type == PromptType.CUSTOM and not custom_instructions:
+                return ProcessingResult(
+                    success=False,
+                    error="Custom instructions required for CUSTOM prompt type",
+                    input_data=cls._kept_input({"text": text_data})
+                )
+            
             # Get provider
             provider = cls.get_provider(provider_name)
             
@@ -392,7 +723,8 @@ Format your response as a professional trading analysis report.
             if config is None:
                 config = cls.DEFAULT_CONFIG
             
-            # Prepare prompt
+            # Prepare prompt; predefined templates keep their static text in the system message
+            static_prefix = ""
             if custom_prompt:
                 # Use custom prompt directly
                 prompt_template = custom_prompt
@@ -405,46 +737,27 @@ Format your response as a professional trading analysis report.
                 prompt_template = cls.PLACEHOLDER_PROMPTS[prompt_type]
                 
                 if prompt_type == PromptType.CUSTOM:
-                    if not custom_instructions:
-                        return ProcessingResult(
-                            success=False,
-                            error="Custom instructions required for CUSTOM prompt type",
-                            input_data={"text": text_data}
-                        )
-                    formatted_prompt = prompt_template.format(
+                    static_prefix, formatted_prompt = _split_template(
+                        prompt_template,
                         json_data=text_data,  # Keep json_data for compatibility
                         custom_instructions=custom_instructions
                     )
                 else:
-                    formatted_prompt = prompt_template.format(json_data=text_data)
+                    static_prefix, formatted_prompt = _split_template(prompt_template, json_data=text_data)
             
             # Prepare messages
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are an expert AI assistant specialized in text analysis and processing. Provide accurate, structured, and actionable responses."
-                },
-                {
-                    "role": "user",
-                    "content": formatted_prompt
-                }
-            ]
+            messages = cls._messages(cls._SYSTEM_MSG_TEXT, static_prefix, formatted_prompt)
             
-            # Debug: Print the messages being sent to the LLM
-            print("=== MESSAGES BEING SENT TO LLM ===")
-            for i, message in enumerate(messages):
-                print(f"Message {i+1} ({message['role']}):")
-                print(f"Content: {message['content']}")
-                print("-" * 50)
-            print("==================================")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LLM messages: %s", messages)
             
             # Generate response
-            response = await provider.generate_response(messages, config)
+            response = await cls._generate(provider, messages, config)
             
             return ProcessingResult(
                 success=True,
                 result=response,
-                input_data={"text": text_data},
+                input_data=cls._kept_input({"text": text_data}),
                 prompt_type=prompt_type.value,
                 model_used=config.model_name
             )
@@ -454,10 +767,68 @@ Format your response as a professional trading analysis report.
             return ProcessingResult(
                 success=False,
                 error=str(e),
-                input_data={"text": text_data},
+                input_data=cls._kept_input({"text": text_data}),
                 prompt_type=prompt_type.value if prompt_type else None
             )
     
+    @classmethod
+    async def _process_json_group(
+        cls,
+        items: List[Union[Dict[str, Any], str]],
+        prompt_type: PromptType,
+        provider: BaseLLMProvider,
+        config: Optional[LLMConfig]
+    ) -> Optional[List[ProcessingResult]]:
+        """
+        Process several JSON items with a single LLM request.
+        
+        The items are sent under "### ITEM <n> ###" headers and the response
+        is split on the same headers.
+        
+        Returns:
+            One result per item, or None if the request failed or the response
+            could not be split, so the caller can process the items one by one
+        """
+        try:
+            loads = orjson.loads if orjson is not None else json.loads
+            data = [loads(item) if isinstance(item, str) else item for item in items]
+            if config is None:
+                config = cls.DEFAULT_CONFIG
+            
+            body = "\n\n".join(
+                f"### ITEM {index} ###\n{_serialize_json(item)}" for index, item in enumerate(data, 1)
+            )
+            static_prefix, user_content = _split_template(cls.PLACEHOLDER_PROMPTS[prompt_type], json_data=body)
+            messages = cls._json_messages(
+                BATCH_ITEMS_INSTRUCTIONS + "\n\n" + static_prefix.lstrip("\n"), user_content
+            )
+            
+            response = await cls._generate(provider, messages, config)
+        except Exception as e:
+            logger.warning(f"Grouped request for {len(items)} items failed, processing them individually: {e}")
+            return None
+        
+        parts = _BATCH_ITEM_PATTERN.split(response)
+        outputs = {}
+        for index, body in zip(parts[1::2], parts[2::2]):
+            body = body.strip()
+            if body:
+                outputs[int(index)] = body
+        if not all(index in outputs for index in range(1, len(data) + 1)):
+            logger.warning(f"Grouped response did not cover all {len(items)} items, processing them individually")
+            return None
+        
+        return [
+            ProcessingResult(
+                success=True,
+                result=outputs[index],
+                input_data=cls._kept_input(item),
+                prompt_type=prompt_type.value,
+                model_used=config.model_name
+            )
+            for index, item in enumerate(data, 1)
+        ]
+    
     @classmethod
     async def batch_process(
         cls,
@@ -465,53 +836,182 @@ Format your response as a professional trading analysis report.
         prompt_type: PromptType = PromptType.ANALYZE,
         provider_name: str = "openai",
         config: Optional[LLMConfig] = None,
-        max_concurrent: int = 3
+        max_concurrent: int = 16,
+        items_per_request: int = 1
     ) -> List[ProcessingResult]:
         """
         Process multiple JSON data items in parallel.
         
+        With items_per_request > 1, up to that many items share one request
+        (and one copy of the prompt instructions). config.max_tokens then
+        bounds the combined output of the group. Groups whose response cannot
+        be split back into items are retried one item per request.
+        
         Args:
             json_data_list: List of JSON data to process
             prompt_type: Type of prompt to use
             provider_name: LLM provider to use
             config: LLM configuration
-            max_concurrent: Maximum concurrent processes
+            max_concurrent: Maximum concurrent requests; they share each provider's
+                            connection pool and rate limiter
+            items_per_request: Maximum number of items packed into one request
             
         Returns:
             List[ProcessingResult]: List of processing results
         """
+        processed_results: List[Optional[ProcessingResult]] = [None] * len(json_data_list)
+        async for index, result in cls.batch_process_iter(
+            json_data_list,
+            prompt_type=prompt_type,
+            provider_name=provider_name,
+            config=config,
+            max_concurrent=max_concurrent,
+            items_per_request=items_per_request
+        ):
+            processed_results[index] = result
+        
+        return processed_results
+    
+    @classmethod
+    async def batch_process_iter(
+        cls,
+        json_data_list: List[Union[Dict[str, Any], str]],
+        prompt_type: PromptType = PromptType.ANALYZE,
+        provider_name: str = "openai",
+        config: Optional[LLMConfig] = None,
+        max_concurrent: int = 16,
+        items_per_request: int = 1
+    ) -> AsyncIterator[Tuple[int, ProcessingResult]]:
+        """
+        Process multiple JSON data items in parallel, yielding results as they complete.
+        
+        Takes the same arguments as batch_process. Callers can handle each
+        result (and let it be freed) as soon as it arrives instead of holding
+        the whole batch; breaking out of the loop cancels the pending requests.
+        
+        Yields:
+            Tuple[int, ProcessingResult]: Index into json_data_list and its result
+        """
         import asyncio
         
+        # Resolve the provider once for the whole batch
+        try:
+            provider = cls.get_provider(provider_name)
+        except Exception as e:
+            logger.error(f"Error processing JSON with LLM: {e}")
+            for index, json_data in enumerate(json_data_list):
+                yield index, ProcessingResult(
+                    success=False,
+                    error=str(e),
+                    input_data=cls._kept_input(json_data),
+                    prompt_type=prompt_type.value
+                )
+            return
+        
         # Create semaphore to limit concurrent requests
         semaphore = asyncio.Semaphore(max_concurrent)
         
-        async def process_single(json_data):
-            async with semaphore:
-                return await cls.process_json_with_prompt(
-                    json_data=json_data,
-                    prompt_type=prompt_type,
-                    provider_name=provider_name,
-                    config=config
+        async def process_single(index, json_data):
+            try:
+                async with semaphore:
+                    result = await cls._process_json_with_prompt_impl(
+                        provider, json_data, prompt_type, None, None, provider_name, config
+                    )
+            except Exception as e:
+                result = ProcessingResult(
+                    success=False,
+                    error=str(e),
+                    input_data=cls._kept_input(json_data)
                 )
+            return [(index, result)]
         
-        # Process all items concurrently
-        tasks = [process_single(json_data) for json_data in json_data_list]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def process_group(start, items):
+            async with semaphore:
+                grouped = await cls._process_json_group(items, prompt_type, provider, config)
+            if grouped is not None:
+                return list(enumerate(grouped, start))
+            singles = await asyncio.gather(*[
+                process_single(start + offset, item) for offset, item in enumerate(items)
+            ])
+            return [pair for single in singles for pair in single]
         
-        # Convert exceptions to ProcessingResult
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                input_item = json_data_list[i] if i < len(json_data_list) else None
-                processed_results.append(ProcessingResult(
-                    success=False,
-                    error=str(result),
-                    input_data=input_item if isinstance(input_item, dict) else None
-                ))
-            else:
-                processed_results.append(result)
+        # CUSTOM needs per-call instructions, which batch processing does not take
+        if items_per_request > 1 and prompt_type != PromptType.CUSTOM:
+            tasks = [
+                asyncio.ensure_future(process_group(start, json_data_list[start:start + items_per_request]))
+                for start in range(0, len(json_data_list), items_per_request)
+            ]
+        else:
+            tasks = [asyncio.ensure_future(process_single(index, json_data))
+                     for index, json_data in enumerate(json_data_list)]
         
-        return processed_results
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for pair in await next_done:
+                    yield pair
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    @classmethod
+    async def batch_process_stream(
+        cls,
+        json_data_list: List[Union[Dict[str, Any], str]],
+        prompt_type: PromptType = PromptType.ANALYZE,
+        provider_name: str = "openai",
+        config: Optional[LLMConfig] = None,
+        max_concurrent: int = 16
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Stream responses for multiple JSON data items processed in parallel.
+        
+        Chunks from different items are interleaved in arrival order. An item
+        whose request fails is logged and its stream simply ends.
+        
+        Args:
+            json_data_list: List of JSON data to process
+            prompt_type: Type of prompt to use
+            provider_name: LLM provider to use
+            config: LLM configuration
+            max_concurrent: Maximum concurrent requests
+            
+        Yields:
+            Tuple[int, str]: Index into json_data_list and a response text chunk
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def stream_single(index, json_data):
+            try:
+                async with semaphore:
+                    async for chunk in cls.process_json_with_prompt_stream(
+                        json_data=json_data,
+                        prompt_type=prompt_type,
+                        provider_name=provider_name,
+                        config=config
+                    ):
+                        await queue.put((index, chunk))
+            except Exception as e:
+                logger.error(f"Error streaming item {index} with LLM: {e}")
+            finally:
+                # None marks the end of this item's stream
+                await queue.put((index, None))
+        
+        tasks = [asyncio.create_task(stream_single(index, json_data))
+                 for index, json_data in enumerate(json_data_list)]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                index, chunk = await queue.get()
+                if chunk is None:
+                    remaining -= 1
+                else:
+                    yield index, chunk
+        finally:
+            for task in tasks:
+                task.cancel()
     
     @classmethod
     def get_available_providers(cls) -> Dict[str, bool]:
@@ -521,8 +1021,7 @@ Format your response as a professional trading analysis report.
         Returns:
             Dict[str, bool]: Provider availability status
         """
-        factory = cls.get_factory()
-        return factory.validate_all_providers()
+        return dict(cls._provider_availability())
     
     @classmethod
     def create_custom_config(
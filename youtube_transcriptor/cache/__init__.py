@@ -0,0 +1 @@
+# Cache package for YouTube Transcriptor
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""On-disk cache for video metadata and transcripts, backed by SQLite."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache:
+    """SQLite-backed key/value store with per-entry expiry and LRU eviction."""
+    
+    def __init__(self, path: str, max_entries: int = 100_000):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: SQLite database file, created if missing
+            max_entries: Least recently used entries beyond this count are evicted
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        # Shared across the extraction thread pool, so serialize access
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """Store a JSON-serializable value for `ttl` seconds."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now + ttl, now)
+            )
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[MetadataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[MetadataCache]:
+    """Get the shared cache, or None when caching is disabled."""
+    global _cache
+    if not get_settings().cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = MetadataCache(get_settings().cache_path)
+    return _cache
+
+
+def cache_lookup(key: str) -> Optional[Any]:
+    """Look up a key in the shared cache, honoring the disable/refresh get_settings()."""
+    cache = get_cache()
+    if cache is None or get_settings().cache_refresh:
+        return None
+    return cache.get(key)
+
+
+def cache_store(key: str, value: Any, ttl: Optional[float] = None):
+    """Store a value in the shared cache if caching is enabled."""
+    cache = get_cache()
+    if cache is not None:
+        cache.set(key, value, get_settings().cache_ttl_seconds if ttl is None else ttl)
+
+
+def cached(key: Callable[..., str], ttl: Optional[float] = None,
+           dump: Callable[[Any], Any] = lambda value: value,
+           load: Callable[[Any], Any] = lambda value: value):
+    """
+    Cache a function's non-None results on disk.
+    
+    Args:
+        key: Builds the cache key from the call's arguments
+        ttl: Seconds before an entry expires (default: settings.cache_ttl_seconds)
+        dump: Converts a result to a JSON-serializable value
+        load: Rebuilds a result from the stored value
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            hit = cache_lookup(cache_key)
+            if hit is not None:
+                logger.debug(f"Cache hit: {cache_key}")
+                return load(hit)
+            
+            result = func(*args, **kwargs)
+            if result is not None:
+                cache_store(cache_key, dump(result), ttl)
+            return result
+        return wrapper
+    return decorator
@@ -1,32 +1,41 @@
 """Command line interface for YouTube Transcriptor."""
 
-import json
+import asyncio
 import csv
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich import print as rprint
-
-from ..core.playlist_extractor import PlaylistExtractor
-from ..core.transcript_extractor import TranscriptExtractor
-from ..core.pipeline import TranscriptionPipeline
-from ..core.models import PlaylistSearchResults
-from ..config.settings import settings
-from ..utils.helpers import format_duration, format_number, truncate_text
+
+from ..utils.helpers import dump_json_bytes, format_duration, format_number, truncate_text, write_json_file
 from ..utils.validators import validate_playlist_url, validate_api_key
 
+# rich, pydantic and the API clients are imported by the commands that use them,
+# so `--help` and argument errors do not pay for loading them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from ..core.models import PlaylistSearchResults
+
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_console() -> 'Console':
+    """Get the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def rprint(*objects, **kwargs):
+    """Print rich markup to the shared console."""
+    _get_console().print(*objects, **kwargs)
+
+
 @click.group()
 @click.option('--api-key', envvar='YOUTUBE_API_KEY', help='YouTube Data API key')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -51,6 +60,18 @@ def cli(ctx, api_key: Optional[str], verbose: bool):
         rprint("[bold red]Warning:[/bold red] API key format looks invalid")
 
 
+def _apply_cache_flags(no_cache: bool, refresh_cache: bool):
+    """Apply the --no-cache/--refresh-cache options to the shared metadata cache."""
+    if no_cache and refresh_cache:
+        raise click.UsageError("--no-cache and --refresh-cache cannot be used together")
+    from ..config.settings import settings
+    
+    if no_cache:
+        settings.cache_enabled = False
+    if refresh_cache:
+        settings.cache_refresh = True
+
+
 @cli.command()
 @click.argument('playlist_url')
 @click.option('--output', '-o', type=click.Choice(['json', 'csv', 'table']), 
@@ -60,12 +81,20 @@ def cli(ctx, api_key: Optional[str], verbose: bool):
               help='Auto-name file using playlist title and save to data/ directory')
 @click.option('--include-description', is_flag=True, 
               help='Include video descriptions in output')
+@click.option('--limit', type=click.IntRange(min=1), default=None,
+              help='Maximum number of videos to show in table output')
+@click.option('--no-cache', is_flag=True,
+              help='Do not read or write the on-disk metadata/transcript cache')
+@click.option('--refresh-cache', is_flag=True,
+              help='Ignore cached metadata/transcripts and store fresh results')
 @click.pass_context
 def extract(ctx, playlist_url: str, output: str, file: Optional[str], 
-           auto_name: bool, include_description: bool):
+           auto_name: bool, include_description: bool, limit: Optional[int],
+           no_cache: bool, refresh_cache: bool):
     """Extract videos from a YouTube playlist."""
     
     api_key = ctx.obj.get('api_key')
+    _apply_cache_flags(no_cache, refresh_cache)
     
     # Validate inputs
     if not validate_playlist_url(playlist_url):
@@ -77,12 +106,15 @@ def extract(ctx, playlist_url: str, output: str, file: Optional[str],
         rprint("Set it via --api-key option or YOUTUBE_API_KEY environment variable")
         sys.exit(1)
     
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from ..core.playlist_extractor import PlaylistExtractor
+    
     # Extract playlist data
     try:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=_get_console()
         ) as progress:
             task = progress.add_task("Extracting playlist data...", total=None)
             
@@ -105,7 +137,7 @@ def extract(ctx, playlist_url: str, output: str, file: Optional[str],
             output_file = f"data/{safe_title}.{extension}"
         
         # Display results
-        _display_results(result, output, output_file, include_description)
+        _display_results(result, output, output_file, include_description, limit)
         
     except KeyboardInterrupt:
         rprint("\n[yellow]Operation cancelled by user[/yellow]")
@@ -148,41 +180,52 @@ def batch_extract(ctx, file_path: str, output: str, output_dir: str):
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
-    # Process each URL
+    from rich.progress import Progress
+    from ..core.playlist_extractor import PlaylistExtractor
+    
+    # Process URLs concurrently; each one is I/O-bound on YouTube API calls
     extractor = PlaylistExtractor(api_key)
     
-    with Progress(console=console) as progress:
-        task = progress.add_task("Processing playlists...", total=len(urls))
+    def _process_one(i: int, url: str):
+        """Extract and save one playlist, returning (url, filepath, ok, error)."""
+        if not validate_playlist_url(url):
+            return url, None, False, None
         
-        for i, url in enumerate(urls):
-            progress.update(task, description=f"Processing playlist {i+1}/{len(urls)}")
+        try:
+            result = extractor.extract_playlist(url)
+            if not result.success:
+                return url, None, False, result.error_message
             
-            if not validate_playlist_url(url):
-                rprint(f"[yellow]Skipping invalid URL:[/yellow] {url}")
-                continue
+            # Save to file
+            filepath = output_path / f"playlist_{i+1}.{output}"
+            if output == 'json':
+                _save_json(result.playlist_data, str(filepath))
+            else:
+                _save_csv(result.playlist_data, str(filepath))
+            return url, filepath, True, None
+        except Exception as e:
+            return url, None, False, e
+    
+    with Progress(console=_get_console()) as progress:
+        task = progress.add_task("Processing playlists...", total=len(urls))
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+            futures = {executor.submit(_process_one, i, url): url for i, url in enumerate(urls)}
             
-            try:
-                result = extractor.extract_playlist(url)
+            for done, future in enumerate(as_completed(futures), 1):
+                url, filepath, ok, err = future.result()
+                progress.update(task, description=f"Processed playlist {done}/{len(urls)}")
                 
-                if result.success:
-                    # Save to file
-                    filename = f"playlist_{i+1}.{output}"
-                    filepath = output_path / filename
-                    
-                    if output == 'json':
-                        _save_json(result.playlist_data, str(filepath))
-                    else:
-                        _save_csv(result.playlist_data, str(filepath))
-                    
+                if ok:
                     rprint(f"[green]✓[/green] Saved: {filepath}")
+                elif err is None:
+                    rprint(f"[yellow]Skipping invalid URL:[/yellow] {url}")
+                elif isinstance(err, Exception):
+                    rprint(f"[red]✗[/red] Error processing {url}: {err}")
                 else:
-                    rprint(f"[red]✗[/red] Failed: {url} - {result.error_message}")
-                    
-            except Exception as e:
-                rprint(f"[red]✗[/red] Error processing {url}: {e}")
-                continue
-            
-            progress.advance(task)
+                    rprint(f"[red]✗[/red] Failed: {url} - {err}")
+                
+                progress.advance(task)
     
     rprint(f"\n[bold green]Batch extraction complete![/bold green]")
     rprint(f"Results saved to: {output_path}")
@@ -201,12 +244,18 @@ def batch_extract(ctx, file_path: str, output: str, output_dir: str):
               help='Use youtube-transcript.io web API (default: enabled)')
 @click.option('--youtube-api-only', is_flag=True,
               help='Use only YouTube transcript API (disables web API)')
+@click.option('--no-cache', is_flag=True,
+              help='Do not read or write the on-disk metadata/transcript cache')
+@click.option('--refresh-cache', is_flag=True,
+              help='Ignore cached metadata/transcripts and store fresh results')
 @click.pass_context
 def search(ctx, search_query: str, playlist: Optional[str], json_file: Optional[str], 
-          case_sensitive: bool, max_results: int, web_api: bool, youtube_api_only: bool):
+          case_sensitive: bool, max_results: int, web_api: bool, youtube_api_only: bool,
+          no_cache: bool, refresh_cache: bool):
     """Search for text across video transcripts."""
     
     api_key = ctx.obj.get('api_key')
+    _apply_cache_flags(no_cache, refresh_cache)
     
     if not playlist and not json_file:
         rprint("[bold red]Error:[/bold red] Must specify either --playlist or --json-file")
@@ -216,11 +265,14 @@ def search(ctx, search_query: str, playlist: Optional[str], json_file: Optional[
         rprint("[bold red]Error:[/bold red] Cannot specify both --playlist and --json-file")
         sys.exit(1)
     
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from ..core.transcript_extractor import TranscriptExtractor
+    
     try:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=_get_console()
         ) as progress:
             
             # Get playlist data
@@ -234,6 +286,7 @@ def search(ctx, search_query: str, playlist: Optional[str], json_file: Optional[
                     sys.exit(1)
                 
                 task = progress.add_task("Extracting playlist data...", total=None)
+                from ..core.playlist_extractor import PlaylistExtractor
                 extractor = PlaylistExtractor(api_key)
                 result = extractor.extract_playlist(playlist)
                 
@@ -245,17 +298,15 @@ def search(ctx, search_query: str, playlist: Optional[str], json_file: Optional[
             else:
                 # Load from JSON file
                 task = progress.add_task("Loading playlist data...", total=None)
-                import json
                 from ..core.models import PlaylistData
                 
                 if not json_file:
                     rprint("[bold red]Error:[/bold red] JSON file path is required")
                     sys.exit(1)
                 
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                playlist_data = PlaylistData(**data)
+                # Validate straight from the raw JSON, skipping the intermediate dict
+                with open(json_file, 'rb') as f:
+                    playlist_data = PlaylistData.model_validate_json(f.read())
             
             progress.update(task, description="Extracting transcripts...")
             
@@ -264,7 +315,7 @@ def search(ctx, search_query: str, playlist: Optional[str], json_file: Optional[
             
             # Extract transcripts
             transcript_extractor = TranscriptExtractor(use_web_api=use_web_api)
-            transcripts = transcript_extractor.extract_playlist_transcripts(playlist_data)
+            transcripts = asyncio.run(transcript_extractor.extract_playlist_transcripts_async(playlist_data))
             
             if not transcripts:
                 rprint("[yellow]Warning:[/yellow] No transcripts found in any videos")
@@ -294,6 +345,9 @@ def search(ctx, search_query: str, playlist: Optional[str], json_file: Optional[
 
 def _display_search_results(results: 'PlaylistSearchResults', max_results: int):
     """Display search results in a formatted table."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
     
     # Search summary panel
     summary_text = f"""[bold]Query:[/bold] "{results.query}"
@@ -302,8 +356,8 @@ def _display_search_results(results: 'PlaylistSearchResults', max_results: int):
 [bold]Videos Searched:[/bold] {results.searched_videos}
 [bold]Search Time:[/bold] {results.search_time_seconds:.2f}s"""
     
-    console.print(Panel(summary_text, title="🔍 Search Results", expand=False))
-    console.print()
+    _get_console().print(Panel(summary_text, title="🔍 Search Results", expand=False))
+    _get_console().print()
     
     if results.total_results == 0:
         rprint("[yellow]No results found.[/yellow]")
@@ -320,48 +374,50 @@ def _display_search_results(results: 'PlaylistSearchResults', max_results: int):
         # Format timestamp
         timestamp = f"{int(result.segment.start // 60):02d}:{int(result.segment.start % 60):02d}"
         
-        # Build context
+        # Build context as styled Text, so transcript text skips markup parsing
+        # (and brackets in it are shown literally)
         context_parts = []
         if result.context_before:
-            context_parts.append(f"[dim]{result.context_before}[/dim]")
+            context_parts += [(result.context_before, "dim"), " "]
         
         # Highlight the matching segment
-        segment_text = result.segment.text
-        context_parts.append(f"[bold yellow]{segment_text}[/bold yellow]")
+        context_parts.append((result.segment.text, "bold yellow"))
         
         if result.context_after:
-            context_parts.append(f"[dim]{result.context_after}[/dim]")
-        
-        context = " ".join(context_parts)
+            context_parts += [" ", (result.context_after, "dim")]
         
         table.add_row(
-            result.video_title,
+            Text(result.video_title),
             timestamp,
-            context
+            Text.assemble(*context_parts)
         )
         
         displayed += 1
     
-    console.print(table)
+    _get_console().print(table)
     
     if results.total_results > max_results:
         rprint(f"\n[dim]Showing {displayed} of {results.total_results} results. Use --max-results to see more.[/dim]")
 
 
 def _display_results(result, output_format: str, output_file: Optional[str], 
-                    include_description: bool):
+                    include_description: bool, limit: Optional[int] = None):
     """Display extraction results in the specified format."""
     
     playlist_data = result.playlist_data
     
     if output_format == 'table':
-        _display_table(playlist_data, include_description)
+        _display_table(playlist_data, include_description, limit)
     elif output_format == 'json':
         if output_file:
             _save_json(playlist_data, output_file)
             rprint(f"[green]Results saved to:[/green] {output_file}")
         else:
-            print(json.dumps(playlist_data.dict(), indent=2, default=str))
+            # Write the encoded bytes directly rather than building and re-encoding a str
+            sys.stdout.flush()
+            sys.stdout.buffer.write(dump_json_bytes(playlist_data.model_dump(mode='json')))
+            sys.stdout.buffer.write(b'\n')
+            sys.stdout.buffer.flush()
     elif output_format == 'csv':
         if output_file:
             _save_csv(playlist_data, output_file)
@@ -370,8 +426,10 @@ def _display_results(result, output_format: str, output_file: Optional[str],
             rprint("[yellow]CSV output requires --file option[/yellow]")
 
 
-def _display_table(playlist_data, include_description: bool):
-    """Display results in a formatted table."""
+def _display_table(playlist_data, include_description: bool, limit: Optional[int] = None):
+    """Display results in a formatted table, with at most `limit` video rows."""
+    from rich.panel import Panel
+    from rich.table import Table
     
     # Playlist info panel
     info_text = f"""[bold]Title:[/bold] {playlist_data.playlist_info.title}
@@ -379,10 +437,11 @@ def _display_table(playlist_data, include_description: bool):
 [bold]Videos:[/bold] {len(playlist_data.videos)}
 [bold]Total Duration:[/bold] {format_duration(playlist_data.total_duration_seconds)}"""
     
-    console.print(Panel(info_text, title="📋 Playlist Information", expand=False))
-    console.print()
+    _get_console().print(Panel(info_text, title="📋 Playlist Information", expand=False))
+    _get_console().print()
     
-    # Videos table
+    # Videos table; rich measures every cell, so only build the rows that are shown
+    videos = playlist_data.videos[:limit] if limit else playlist_data.videos
     table = Table(title="🎥 Videos")
     table.add_column("Title", style="cyan", no_wrap=False, max_width=40)
     table.add_column("Channel", style="green", max_width=20)
@@ -393,7 +452,7 @@ def _display_table(playlist_data, include_description: bool):
     if include_description:
         table.add_column("Description", max_width=30)
     
-    for video in playlist_data.videos:
+    for video in videos:
         row = [
             video.title,
             video.channel_title,
@@ -407,18 +466,21 @@ def _display_table(playlist_data, include_description: bool):
         
         table.add_row(*row)
     
-    console.print(table)
+    _get_console().print(table)
+    
+    if len(videos) < len(playlist_data.videos):
+        rprint(f"\n[dim]Showing {len(videos)} of {len(playlist_data.videos)} videos. Use --limit to see more.[/dim]")
 
 
 def _save_json(playlist_data, filepath: str):
     """Save playlist data as JSON."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(playlist_data.dict(), f, indent=2, default=str, ensure_ascii=False)
+    write_json_file(filepath, playlist_data.model_dump(mode='json'))
 
 
 def _save_csv(playlist_data, filepath: str):
     """Save playlist data as CSV."""
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+    # A large buffer cuts write syscalls for playlists with many videos
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
         writer = csv.writer(f)
         
         # Header
@@ -427,9 +489,9 @@ def _save_csv(playlist_data, filepath: str):
             'Views', 'Likes', 'Comments', 'Published', 'Description'
         ])
         
-        # Data
-        for video in playlist_data.videos:
-            writer.writerow([
+        # Data, streamed through the csv module's C row loop
+        writer.writerows(
+            (
                 video.id,
                 video.title,
                 video.channel_title,
@@ -439,7 +501,9 @@ def _save_csv(playlist_data, filepath: str):
                 video.comment_count or 0,
                 video.published_at.isoformat() if video.published_at else '',
                 video.description or ''
-            ])
+            )
+            for video in playlist_data.videos
+        )
 
 
 @cli.command()
@@ -448,11 +512,17 @@ def _save_csv(playlist_data, filepath: str):
               help='Base output directory for organized transcripts')
 @click.option('--web-api/--no-web-api', default=True,
               help='Use youtube-transcript.io web API (recommended)')
+@click.option('--no-cache', is_flag=True,
+              help='Do not read or write the on-disk metadata/transcript cache')
+@click.option('--refresh-cache', is_flag=True,
+              help='Ignore cached metadata/transcripts and store fresh results')
 @click.pass_context
-def transcribe(ctx, playlist_url: str, output_dir: str, web_api: bool):
+def transcribe(ctx, playlist_url: str, output_dir: str, web_api: bool,
+               no_cache: bool, refresh_cache: bool):
     """Complete pipeline: extract playlist and save organized transcript files."""
     
     api_key = ctx.obj.get('api_key')
+    _apply_cache_flags(no_cache, refresh_cache)
     
     if not validate_playlist_url(playlist_url):
         rprint("[bold red]Error:[/bold red] Invalid playlist URL or ID")
@@ -463,11 +533,14 @@ def transcribe(ctx, playlist_url: str, output_dir: str, web_api: bool):
         rprint("Set it via --api-key option or YOUTUBE_API_KEY environment variable")
         sys.exit(1)
     
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from ..core.pipeline import TranscriptionPipeline
+    
     try:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=_get_console()
         ) as progress:
             
             # Initialize pipeline
@@ -500,6 +573,7 @@ def transcribe(ctx, playlist_url: str, output_dir: str, web_api: bool):
 
 def _display_pipeline_results(results):
     """Display pipeline processing results."""
+    from rich.panel import Panel
     
     # Pipeline summary panel
     playlist_data = results["playlist_data"]
@@ -511,8 +585,8 @@ def _display_pipeline_results(results):
 [bold]Success Rate:[/bold] {(results["transcripts_processed"]/playlist_data["video_count"]*100):.1f}%
 [bold]Output Directory:[/bold] {results["output_directory"]}"""
     
-    console.print(Panel(summary_text, title="🎬 Pipeline Results", expand=False))
-    console.print()
+    _get_console().print(Panel(summary_text, title="🎬 Pipeline Results", expand=False))
+    _get_console().print()
     
     # Files saved
     rprint(f"[green]📁 Files created:[/green]")
@@ -1,11 +1,8 @@
 """Configuration settings for YouTube Transcriptor."""
 
 import os
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 
 class Settings:
@@ -20,6 +17,7 @@ class Settings:
         self.request_timeout: int = 30
         self.max_retries: int = 3
         self.retry_delay: float = 1.0
+        self.youtube_api_qps: float = float(os.getenv("YOUTUBE_API_QPS", "10"))
         
         # Transcript API Configuration (youtube-transcript.io)
         self.transcript_api_token: Optional[str] = os.getenv("TRANSCRIPT_API_TOKEN")
@@ -28,6 +26,15 @@ class Settings:
         self.transcript_rate_limit_requests: int = int(os.getenv("TRANSCRIPT_RATE_LIMIT_REQUESTS", "5"))
         self.transcript_rate_limit_window: int = int(os.getenv("TRANSCRIPT_RATE_LIMIT_WINDOW", "10"))
         
+        # Concurrent per-video transcript requests when processing a playlist
+        self.max_concurrent_videos: int = int(os.getenv("MAX_CONCURRENT_VIDEOS", "20"))
+        
+        # On-disk cache for video metadata and transcripts
+        self.cache_enabled: bool = os.getenv("YT_CACHE_ENABLED", "true").lower() != "false"
+        self.cache_refresh: bool = False  # Ignore existing entries but store fresh results
+        self.cache_path: str = os.getenv("YT_CACHE_PATH", ".cache/metadata.sqlite3")
+        self.cache_ttl_seconds: int = int(os.getenv("YT_CACHE_TTL_SECONDS", str(7 * 86400)))
+        
     def validate(self) -> bool:
         """Validate that required settings are present."""
         if not self.youtube_api_key:
@@ -37,5 +44,18 @@ class Settings:
         return True
 
 
-# Global settings instance
-settings = Settings() 
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Get the global settings instance, loading the .env file on first use."""
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file
+    load_dotenv()
+    return Settings()
+
+
+def __getattr__(name: str):
+    # The global `settings` instance is built on first access rather than at import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
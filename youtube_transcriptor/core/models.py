@@ -1,8 +1,13 @@
 """Data models for YouTube playlist and video information."""
 
+import re
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
+
+
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
 
 
 class ChannelInfo(BaseModel):
@@ -22,6 +27,8 @@ class ChannelInfo(BaseModel):
 class VideoThumbnail(BaseModel):
     """Video thumbnail information."""
     
+    model_config = ConfigDict(frozen=True)
+    
     url: str
     width: int
     height: int
@@ -30,6 +37,8 @@ class VideoThumbnail(BaseModel):
 class VideoInfo(BaseModel):
     """Information about a YouTube video."""
     
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     title: str
     description: Optional[str] = None
@@ -51,38 +60,32 @@ class VideoInfo(BaseModel):
     default_language: Optional[str] = None
     privacy_status: Optional[str] = None
     
-    @validator('duration_seconds', pre=True, always=True)
-    def parse_duration(cls, v, values):
+    @model_validator(mode='before')
+    @classmethod
+    def parse_duration(cls, data: Any) -> Any:
         """Parse ISO 8601 duration to seconds."""
-        if v is not None:
-            return v
-        
-        duration_iso = values.get('duration_iso')
-        if duration_iso:
-            return cls._parse_iso_duration(duration_iso)
-        return None
+        # A model-level check, since duration_iso is declared after duration_seconds
+        # and a field validator would not see it yet
+        if isinstance(data, dict) and data.get('duration_seconds') is None and data.get('duration_iso'):
+            data = {**data, 'duration_seconds': cls._parse_iso_duration(data['duration_iso'])}
+        return data
     
     @staticmethod
     def _parse_iso_duration(duration: str) -> int:
         """Parse ISO 8601 duration (PT1H2M3S) to seconds."""
-        import re
-        
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration)
-        
+        match = _ISO_DURATION_RE.match(duration)
         if not match:
             return 0
-            
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
         
-        return hours * 3600 + minutes * 60 + seconds
+        hours, minutes, seconds = match.groups()
+        return int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds or 0)
 
 
 class PlaylistInfo(BaseModel):
     """Information about a YouTube playlist."""
     
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     title: str
     description: Optional[str] = None
@@ -105,21 +108,17 @@ class PlaylistData(BaseModel):
     
     playlist_info: PlaylistInfo
     videos: List[VideoInfo]
-    total_duration_seconds: Optional[int] = None
+    total_duration_seconds: Optional[int] = Field(default=None, validate_default=True)
     extracted_at: datetime = Field(default_factory=datetime.now)
     
-    @validator('total_duration_seconds', pre=True, always=True)
-    def calculate_total_duration(cls, v, values):
+    @field_validator('total_duration_seconds', mode='before')
+    @classmethod
+    def calculate_total_duration(cls, v: Optional[int], info: ValidationInfo) -> Optional[int]:
         """Calculate total duration from all videos."""
         if v is not None:
             return v
-            
-        videos = values.get('videos', [])
-        total = 0
-        for video in videos:
-            if video.duration_seconds:
-                total += video.duration_seconds
         
+        total = sum(video.duration_seconds or 0 for video in info.data.get('videos', []))
         return total if total > 0 else None
 
 
@@ -157,12 +156,13 @@ class VideoTranscript(BaseModel):
     segments: List[TranscriptSegment]
     extracted_at: datetime = Field(default_factory=datetime.now)
     
-    @property
+    # Computed on first access and kept; transcripts are not edited after extraction
+    @cached_property
     def full_text(self) -> str:
         """Get combined text from all segments."""
-        return " ".join(segment.text for segment in self.segments)
+        return " ".join([segment.text for segment in self.segments])
     
-    @property
+    @cached_property
     def word_count(self) -> int:
         """Count words in transcript."""
         return len(self.full_text.split())
@@ -4,7 +4,6 @@ Extracts playlist videos, transcripts, and saves organized aggregated transcript
 """
 
 import os
-import json
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -13,8 +12,8 @@ from datetime import datetime
 from .playlist_extractor import PlaylistExtractor
 from .transcript_extractor import TranscriptExtractor
 from .models import PlaylistData, VideoTranscript
-from ..utils.helpers import sanitize_filename
-from ..config.settings import settings
+from ..utils.helpers import aggregate_segments, normalize_text, sanitize_filename, write_json_file
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +29,7 @@ class TranscriptionPipeline:
             youtube_api_key: YouTube Data API key
             use_web_api: Whether to use web API for transcripts (recommended)
         """
-        self.youtube_api_key = youtube_api_key or settings.youtube_api_key
+        self.youtube_api_key = youtube_api_key or get_settings().youtube_api_key
         self.use_web_api = use_web_api
         
         if not self.youtube_api_key:
@@ -154,8 +153,8 @@ class TranscriptionPipeline:
                     logger.warning(f"Video metadata not found for {transcript.video_id}")
                     continue
                 
-                # Aggregate transcript segments into continuous text
-                aggregated_text = self._aggregate_transcript_text(transcript)
+                # Aggregate text, word count and segment dicts in a single pass
+                aggregated_text, word_count, segments = aggregate_segments(transcript.segments)
                 
                 # Create comprehensive video data
                 video_data = {
@@ -176,19 +175,11 @@ class TranscriptionPipeline:
                         "total_segments": len(transcript.segments),
                         "aggregated_text": aggregated_text,
                         "text_length": len(aggregated_text),
-                        "word_count": len(aggregated_text.split()) if aggregated_text else 0
+                        "word_count": word_count
                     },
                     
                     # Detailed segments (optional, for reference)
-                    "segments": [
-                        {
-                            "start": segment.start,
-                            "duration": segment.duration,
-                            "text": segment.text,
-                            "timestamp": f"{int(segment.start // 60):02d}:{int(segment.start % 60):02d}"
-                        }
-                        for segment in transcript.segments
-                    ],
+                    "segments": segments,
                     
                     # Metadata
                     "extraction_timestamp": datetime.now().isoformat(),
@@ -201,8 +192,7 @@ class TranscriptionPipeline:
                 filepath = output_dir / filename
                 
                 # Save file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(video_data, f, indent=2, ensure_ascii=False)
+                write_json_file(filepath, video_data)
                 
                 saved_files.append(str(filepath))
                 logger.debug(f"Saved transcript: {filename}")
@@ -220,13 +210,8 @@ class TranscriptionPipeline:
         if not transcript.segments:
             return ""
         
-        # Join all segment texts with spaces
-        aggregated = " ".join(segment.text for segment in transcript.segments if segment.text.strip())
-        
-        # Clean up extra whitespace
-        aggregated = " ".join(aggregated.split())
-        
-        return aggregated
+        # Join all segment texts with spaces, then clean up whitespace in one regex pass
+        return normalize_text(" ".join([segment.text for segment in transcript.segments]))
     
     def _create_summary_file(self, playlist_data: PlaylistData, transcripts: List[VideoTranscript], 
                            output_dir: Path, results: Dict[str, Any]) -> Path:
@@ -283,8 +268,7 @@ class TranscriptionPipeline:
         summary_filename = f"_playlist_summary_{sanitize_filename(playlist_data.playlist_info.title)}.json"
         summary_filepath = output_dir / summary_filename
         
-        with open(summary_filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        write_json_file(summary_filepath, summary_data)
         
         logger.info(f"Created playlist summary: {summary_filename}")
         return summary_filepath
@@ -305,7 +289,7 @@ class TranscriptionPipeline:
         return {
             "youtube_api_configured": bool(self.youtube_api_key),
             "web_api_enabled": self.use_web_api,
-            "web_api_token_configured": bool(settings.transcript_api_token),
+            "web_api_token_configured": bool(get_settings().transcript_api_token),
             "pipeline_components": {
                 "playlist_extractor": "PlaylistExtractor",
                 "transcript_extractor": "TranscriptExtractor",
@@ -2,6 +2,7 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List
 from .youtube_client import YouTubeClient
@@ -9,6 +10,7 @@ from .models import (
     PlaylistInfo, VideoInfo, PlaylistData, ExtractionResult,
     VideoThumbnail, ChannelInfo
 )
+from ..cache.metadata_cache import cache_lookup, cache_store
 from ..utils.helpers import parse_playlist_url, format_duration
 from ..utils.validators import validate_playlist_url
 
@@ -51,8 +53,30 @@ class PlaylistExtractor:
                     error_message=f"Playlist not found or not accessible: {playlist_id}"
                 )
             
-            # Get all video IDs from playlist
-            video_ids = self.youtube_client.get_playlist_videos(playlist_id)
+            # The playlist ETag changes whenever the playlist or its items do, so a
+            # matching cached entry skips paging through items and video details
+            cache_key = f"playlist:{playlist_id}"
+            etag = playlist_raw.get('etag')
+            hit = cache_lookup(cache_key)
+            if hit is not None and etag and hit.get('etag') == etag:
+                logger.info(f"Using cached playlist data for {playlist_id}")
+                playlist_data = PlaylistData.model_validate(hit['data'])
+                return ExtractionResult(
+                    success=True,
+                    playlist_data=playlist_data,
+                    videos_processed=len(playlist_data.videos),
+                    extraction_time_seconds=time.time() - start_time
+                )
+            
+            # Get detailed video information for each page of IDs while the next page is fetched
+            video_ids = []
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                futures = []
+                for page in self.youtube_client.iter_playlist_video_pages(playlist_id):
+                    video_ids.extend(page)
+                    futures.append(executor.submit(self.youtube_client.get_videos_info, page))
+                videos_raw = [video for future in futures for video in future.result()]
+            
             if not video_ids:
                 return ExtractionResult(
                     success=False,
@@ -61,9 +85,6 @@ class PlaylistExtractor:
             
             logger.info(f"Found {len(video_ids)} videos in playlist")
             
-            # Get detailed video information
-            videos_raw = self.youtube_client.get_videos_info(video_ids)
-            
             # Process the data
             playlist_info = self._process_playlist_info(playlist_raw)
             videos_info = self._process_videos_info(videos_raw)
@@ -74,6 +95,8 @@ class PlaylistExtractor:
                 videos=videos_info
             )
             
+            cache_store(cache_key, {'etag': etag, 'data': playlist_data.model_dump(mode="json")})
+            
             extraction_time = time.time() - start_time
             
             return ExtractionResult(
@@ -1,9 +1,13 @@
 """Transcript extraction and search functionality."""
 
+import asyncio
 import time
 import logging
 import re
-from typing import List, Optional, Dict, Any
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import Callable, List, Optional, Dict, Any
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
 
@@ -12,11 +16,22 @@ from .models import (
     PlaylistSearchResults, PlaylistData
 )
 from .web_transcript_extractor import WebTranscriptExtractor
-from ..config.settings import settings
+from ..cache.metadata_cache import cached, cache_lookup, cache_store
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def _transcript_key(self, video_id: str, *args, **kwargs) -> str:
+    """Cache key for a video's transcript."""
+    return f"transcript:{video_id}"
+
+
+def _dump_transcript(transcript: VideoTranscript) -> Dict[str, Any]:
+    """Convert a transcript to a JSON-serializable dict for caching."""
+    return transcript.model_dump(mode="json")
+
+
 class TranscriptExtractor:
     """Extract and search transcripts from YouTube videos."""
     
@@ -28,22 +43,23 @@ class TranscriptExtractor:
             use_web_api: Whether to use youtube-transcript.io web API as primary method
         """
         self.api = YouTubeTranscriptApi()
-        self.use_web_api = use_web_api and settings.transcript_api_token
+        self.use_web_api = use_web_api and get_settings().transcript_api_token
         self.web_extractor = None
         
         if self.use_web_api:
-            self.web_extractor = WebTranscriptExtractor(settings.transcript_api_token)
+            self.web_extractor = WebTranscriptExtractor(get_settings().transcript_api_token)
             logger.info("Web transcript API enabled (youtube-transcript.io)")
         else:
             logger.info("Using YouTube Transcript API only")
     
+    @cached(key=_transcript_key, dump=_dump_transcript, load=VideoTranscript.model_validate)
     def extract_video_transcript(self, video_id: str, video_title: str = "") -> Optional[VideoTranscript]:
         """Extract transcript for a single video."""
         # Try web API first if available
         if self.use_web_api and self.web_extractor:
             try:
                 transcript = self.web_extractor.extract_video_transcript(
-                    video_id, video_title, settings.transcript_country_code
+                    video_id, video_title, get_settings().transcript_country_code
                 )
                 if transcript:
                     logger.debug(f"Successfully extracted transcript via web API for {video_id}")
@@ -88,21 +104,60 @@ class TranscriptExtractor:
         else:
             return self._extract_playlist_transcripts_sequential(playlist_data)
     
+    async def extract_playlist_transcripts_async(self, playlist_data: PlaylistData) -> List[VideoTranscript]:
+        """
+        Extract transcripts for all videos in a playlist without blocking the event loop.
+        
+        The transcript clients are synchronous, so each per-video request runs
+        in a worker thread; a TaskGroup fans them out, up to
+        settings.max_concurrent_videos at once. With the web API, the batch
+        endpoint already covers many videos per request and runs as one task.
+        """
+        if self.use_web_api and self.web_extractor:
+            return await asyncio.to_thread(self._extract_playlist_transcripts_batch, playlist_data)
+        
+        videos = playlist_data.videos
+        logger.info(f"Extracting transcripts for {len(videos)} videos "
+                    f"({get_settings().max_concurrent_videos} concurrent)")
+        semaphore = asyncio.Semaphore(max(1, get_settings().max_concurrent_videos))
+        
+        async def fetch(video) -> Optional[VideoTranscript]:
+            async with semaphore:
+                return await asyncio.to_thread(self.extract_video_transcript, video.id, video.title)
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch(video)) for video in videos]
+        
+        transcripts = [task.result() for task in tasks if task.result()]
+        logger.info(f"Successfully extracted {len(transcripts)} transcripts")
+        return transcripts
+    
     def _extract_playlist_transcripts_batch(self, playlist_data: PlaylistData) -> List[VideoTranscript]:
         """Extract transcripts using web API batch processing."""
         logger.info(f"Extracting transcripts for {len(playlist_data.videos)} videos using batch processing")
         
+        # Reuse transcripts cached by earlier runs
+        transcripts = []
+        for video in playlist_data.videos:
+            hit = cache_lookup(_transcript_key(self, video.id))
+            if hit is not None:
+                transcripts.append(VideoTranscript.model_validate(hit))
+        if transcripts:
+            logger.info(f"Loaded {len(transcripts)} transcripts from cache")
+        cached_video_ids = {t.video_id for t in transcripts}
+        
         # Prepare video data
-        video_ids = [video.id for video in playlist_data.videos]
+        video_ids = [video.id for video in playlist_data.videos if video.id not in cached_video_ids]
         video_titles = {video.id: video.title for video in playlist_data.videos}
         
         # Use web API batch extraction
-        if self.web_extractor:
-            transcripts = self.web_extractor.extract_batch_transcripts(
-                video_ids, video_titles, settings.transcript_country_code
+        if self.web_extractor and video_ids:
+            fetched = self.web_extractor.extract_batch_transcripts(
+                video_ids, video_titles, get_settings().transcript_country_code
             )
-        else:
-            transcripts = []
+            for transcript in fetched:
+                cache_store(_transcript_key(self, transcript.video_id), _dump_transcript(transcript))
+            transcripts.extend(fetched)
         
         # For videos that failed with web API, try individual YouTube API extraction
         successful_video_ids = {t.video_id for t in transcripts}
@@ -110,8 +165,7 @@ class TranscriptExtractor:
         
         if failed_videos:
             logger.info(f"Retrying {len(failed_videos)} failed videos with YouTube API")
-            for video in failed_videos:
-                transcript = self._extract_with_youtube_api(video.id, video.title)
+            for video, transcript in self._extract_concurrently(failed_videos, self._extract_with_youtube_api):
                 if transcript:
                     transcripts.append(transcript)
         
@@ -122,10 +176,10 @@ class TranscriptExtractor:
         """Extract transcripts sequentially (fallback method)."""
         transcripts = []
         
-        logger.info(f"Extracting transcripts for {len(playlist_data.videos)} videos sequentially")
+        logger.info(f"Extracting transcripts for {len(playlist_data.videos)} videos "
+                    f"({get_settings().max_concurrent_videos} concurrent)")
         
-        for video in playlist_data.videos:
-            transcript = self.extract_video_transcript(video.id, video.title)
+        for video, transcript in self._extract_concurrently(playlist_data.videos, self.extract_video_transcript):
             if transcript:
                 transcripts.append(transcript)
                 logger.debug(f"Successfully extracted transcript for {video.title}")
@@ -135,6 +189,21 @@ class TranscriptExtractor:
         logger.info(f"Successfully extracted {len(transcripts)} transcripts")
         return transcripts
     
+    def _extract_concurrently(self, videos: List[Any],
+                              extract: Callable[[str, str], Optional[VideoTranscript]]):
+        """
+        Run a per-video extraction across a thread pool.
+        
+        Requests are I/O-bound, so up to settings.max_concurrent_videos run at
+        once; results are yielded as (video, transcript) in playlist order.
+        """
+        max_workers = max(1, min(get_settings().max_concurrent_videos, len(videos)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(extract, video.id, video.title) for video in videos]
+            for video, future in zip(videos, futures):
+                yield video, future.result()
+    
+    @cached(key=_transcript_key, dump=_dump_transcript, load=VideoTranscript.model_validate)
     def _extract_with_youtube_api(self, video_id: str, video_title: str = "") -> Optional[VideoTranscript]:
         """Extract transcript using only YouTube API (fallback method)."""
         try:
@@ -190,33 +259,48 @@ class TranscriptExtractor:
     
     def _search_video_transcript(self, transcript: VideoTranscript, query: str, 
                                case_sensitive: bool) -> List[SearchResult]:
-        """Search within a single video transcript."""
+        """
+        Search within a single video transcript.
+        
+        Segments are joined into one string and scanned with str.find, so
+        Python-level work is per match rather than per segment. Matches that
+        span the separator between two segments are skipped.
+        """
         results = []
+        segments = transcript.segments
+        if not segments:
+            return results
+        
+        texts = [segment.text if case_sensitive else segment.text.lower() for segment in segments]
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+        full_text = "\n".join(texts)
+        contexts = {}
         
-        for i, segment in enumerate(transcript.segments):
-            text = segment.text if case_sensitive else segment.text.lower()
+        # Find all occurrences, including overlapping ones
+        pos = full_text.find(query)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            match_position = pos - starts[i]
             
-            # Find all occurrences in this segment
-            start_pos = 0
-            while True:
-                pos = text.find(query, start_pos)
-                if pos == -1:
-                    break
-                
-                # Get context
-                context_before = self._get_context_before(transcript.segments, i)
-                context_after = self._get_context_after(transcript.segments, i)
+            if match_position + len(query) <= len(texts[i]):
+                # Get context, once per matching segment
+                if i not in contexts:
+                    contexts[i] = (
+                        self._get_context_before(segments, i),
+                        self._get_context_after(segments, i)
+                    )
+                context_before, context_after = contexts[i]
                 
                 results.append(SearchResult(
                     video_id=transcript.video_id,
                     video_title=transcript.video_title,
-                    segment=segment,
+                    segment=segments[i],
                     context_before=context_before,
                     context_after=context_after,
-                    match_position=pos
+                    match_position=match_position
                 ))
-                
-                start_pos = pos + 1
+            
+            pos = full_text.find(query, pos + 1)
         
         return results
     
@@ -5,16 +5,31 @@ This provides an alternative to the blocked YouTube transcript API.
 
 import time
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import json
 
 from .models import TranscriptSegment, VideoTranscript
-from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session, so every extractor reuses pooled keep-alive connections."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+            _session.mount("https://", adapter)
+    return _session
+
 
 class WebTranscriptExtractor:
     """Extract transcripts using youtube-transcript.io API."""
@@ -31,6 +46,7 @@ class WebTranscriptExtractor:
         self.rate_limit_requests = 5  # 5 requests per 10 seconds
         self.rate_limit_window = 10   # seconds
         self.request_times = []  # Track request timestamps for rate limiting
+        self._rate_limit_lock = threading.Lock()  # Shared by concurrent extraction threads
         
         if not self.api_token:
             logger.warning("No API token provided for youtube-transcript.io")
@@ -188,10 +204,7 @@ class WebTranscriptExtractor:
         }
         
         try:
-            # Record request time for rate limiting
-            self.request_times.append(time.time())
-            
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = _get_session().post(url, headers=headers, json=payload, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -220,17 +233,21 @@ class WebTranscriptExtractor:
     
     def _wait_for_rate_limit(self):
         """Wait if necessary to respect rate limits (5 requests per 10 seconds)."""
-        current_time = time.time()
-        
-        # Remove old request times outside the window
-        self.request_times = [t for t in self.request_times if current_time - t < self.rate_limit_window]
-        
-        # If we're at the limit, wait
-        if len(self.request_times) >= self.rate_limit_requests:
-            sleep_time = self.rate_limit_window - (current_time - self.request_times[0]) + 0.1
-            if sleep_time > 0:
-                logger.info(f"Rate limiting: waiting {sleep_time:.1f} seconds")
-                time.sleep(sleep_time)
+        with self._rate_limit_lock:
+            current_time = time.time()
+            
+            # Remove old request times outside the window
+            self.request_times = [t for t in self.request_times if current_time - t < self.rate_limit_window]
+            
+            # If we're at the limit, wait
+            if len(self.request_times) >= self.rate_limit_requests:
+                sleep_time = self.rate_limit_window - (current_time - self.request_times[0]) + 0.1
+                if sleep_time > 0:
+                    logger.info(f"Rate limiting: waiting {sleep_time:.1f} seconds")
+                    time.sleep(sleep_time)
+            
+            # Reserve this slot before releasing the lock so concurrent callers see it
+            self.request_times.append(time.time())
     
     def _parse_transcript_segments(self, transcript_data: List[Dict[str, Any]]) -> List[TranscriptSegment]:
         """
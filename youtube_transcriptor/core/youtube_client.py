@@ -2,10 +2,15 @@
 
 import time
 import logging
-from typing import Optional, List, Dict, Any
+import queue
+import random
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from ..config.settings import settings
+from ..config.settings import get_settings
+from ..utils.rate_limiter import get_youtube_api_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -15,25 +20,45 @@ class YouTubeClient:
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize YouTube client with API key."""
-        self.api_key = api_key or settings.youtube_api_key
+        self.api_key = api_key or get_settings().youtube_api_key
         if not self.api_key:
             raise ValueError("YouTube API key is required")
         
         self.service = build(
-            settings.youtube_api_service_name,
-            settings.youtube_api_version,
+            get_settings().youtube_api_service_name,
+            get_settings().youtube_api_version,
             developerKey=self.api_key
         )
+        # httplib2 connections are not thread-safe, so each request checks one out of
+        # this pool; idle keep-alive connections outlive the short-lived worker threads
+        # that used them, and the pool grows only to the peak number of concurrent requests
+        self._http_pool: "queue.SimpleQueue[httplib2.Http]" = queue.SimpleQueue()
+    
+    @contextmanager
+    def _checkout_http(self) -> Iterator[httplib2.Http]:
+        """Borrow an idle HTTP connection, creating one if none is free."""
+        try:
+            http = self._http_pool.get_nowait()
+        except queue.Empty:
+            http = httplib2.Http(timeout=get_settings().request_timeout)
+        try:
+            yield http
+        finally:
+            self._http_pool.put(http)
     
     def _make_request_with_retry(self, request) -> Optional[Dict[str, Any]]:
         """Make API request with retry logic."""
+        settings = get_settings()
         for attempt in range(settings.max_retries):
             try:
-                return request.execute()
+                get_youtube_api_limiter().acquire()
+                with self._checkout_http() as http:
+                    return request.execute(http=http)
             except HttpError as e:
                 if e.resp.status == 429:  # Rate limit exceeded
-                    wait_time = settings.retry_delay * (2 ** attempt)
-                    logger.warning(f"Rate limit exceeded. Waiting {wait_time} seconds...")
+                    # Jitter keeps concurrent callers from retrying in lockstep
+                    wait_time = settings.retry_delay * (2 ** attempt) + random.uniform(0, settings.retry_delay)
+                    logger.warning(f"Rate limit exceeded. Waiting {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                     continue
                 elif e.resp.status == 403:  # Quota exceeded
@@ -69,9 +94,8 @@ class YouTubeClient:
             logger.error(f"Error getting playlist info: {e}")
             return None
     
-    def get_playlist_videos(self, playlist_id: str) -> List[str]:
-        """Get all video IDs from a playlist."""
-        video_ids = []
+    def iter_playlist_video_pages(self, playlist_id: str) -> Iterator[List[str]]:
+        """Yield a playlist's video IDs one API page (up to 50 IDs) at a time."""
         next_page_token = None
         
         try:
@@ -79,7 +103,7 @@ class YouTubeClient:
                 request = self.service.playlistItems().list(
                     part="contentDetails",
                     playlistId=playlist_id,
-                    maxResults=settings.max_results_per_request,
+                    maxResults=get_settings().max_results_per_request,
                     pageToken=next_page_token
                 )
                 
@@ -87,9 +111,9 @@ class YouTubeClient:
                 if not response:
                     break
                 
-                for item in response.get('items', []):
-                    video_id = item['contentDetails']['videoId']
-                    video_ids.append(video_id)
+                page = [item['contentDetails']['videoId'] for item in response.get('items', [])]
+                if page:
+                    yield page
                 
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
@@ -97,8 +121,10 @@ class YouTubeClient:
                     
         except Exception as e:
             logger.error(f"Error getting playlist videos: {e}")
-        
-        return video_ids
+    
+    def get_playlist_videos(self, playlist_id: str) -> List[str]:
+        """Get all video IDs from a playlist."""
+        return [video_id for page in self.iter_playlist_video_pages(playlist_id) for video_id in page]
     
     def get_videos_info(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         """Get detailed information for multiple videos."""
@@ -1,8 +1,21 @@
 """Helper utility functions."""
 
+import json
 import re
-from typing import Optional
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse, parse_qs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# C0 control characters that are not whitespace, plus DEL
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0e-\x1b\x7f]')
 
 
 def parse_playlist_url(url: str) -> Optional[str]:
@@ -100,6 +113,7 @@ def is_valid_youtube_url(url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file system operations."""
     # Remove or replace invalid characters
@@ -116,4 +130,53 @@ def sanitize_filename(filename: str) -> str:
     if len(sanitized) > 200:
         sanitized = sanitized[:200]
     
-    return sanitized or "untitled" 
\ No newline at end of file
+    return sanitized or "untitled" 
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize text, drop control characters and collapse whitespace runs to single spaces."""
+    text = unicodedata.normalize('NFC', text)
+    return _WHITESPACE_RE.sub(' ', _CONTROL_CHARS_RE.sub('', text)).strip()
+
+
+def aggregate_segments(segments: Iterable[Any]) -> Tuple[str, int, List[Dict[str, Any]]]:
+    """
+    Build the aggregated text, word count and JSON-ready segment dicts in one pass.
+    
+    Returns:
+        Tuple of (normalized aggregated text, word count, segment dicts with an MM:SS timestamp)
+    """
+    texts = []
+    segment_dicts = []
+    append_text = texts.append
+    append_segment = segment_dicts.append
+    for segment in segments:
+        start = segment.start
+        text = segment.text
+        append_text(text)
+        # One integer divmod instead of a float // and % per segment
+        minutes, seconds = divmod(int(start), 60)
+        append_segment({
+            "start": start,
+            "duration": segment.duration,
+            "text": text,
+            "timestamp": f"{minutes:02d}:{seconds:02d}"
+        })
+    
+    aggregated_text = normalize_text(" ".join(texts))
+    # Normalized text has single spaces between words, so no split() is needed to count them
+    word_count = aggregated_text.count(" ") + 1 if aggregated_text else 0
+    return aggregated_text, word_count, segment_dicts
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json_file(filepath: Union[str, Path], data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    with open(filepath, 'wb') as f:
+        f.write(dump_json_bytes(data))
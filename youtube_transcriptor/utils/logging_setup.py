@@ -0,0 +1,38 @@
+"""Queue-based logging setup for the command line scripts."""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_queue_logging(logger_name: str, level: int = logging.INFO,
+                        fmt: str = "%(message)s") -> QueueListener:
+    """
+    Route all log records through a queue drained by one background thread.
+    
+    Callers only enqueue records, so concurrent workers never contend on
+    stdout. The named logger is set to `level`; other loggers keep the
+    root's WARNING level.
+    
+    Args:
+        logger_name: Logger used by the calling script
+        level: Level for that logger
+        fmt: Format applied by the stdout handler
+        
+    Returns:
+        The started listener; call stop() before exiting to flush it
+    """
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(fmt))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.WARNING)
+    logging.getLogger(logger_name).setLevel(level)
+    
+    listener.start()
+    return listener
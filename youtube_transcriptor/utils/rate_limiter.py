@@ -0,0 +1,45 @@
+"""Thread-safe token bucket for pacing outbound API requests."""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+
+from ..config.settings import get_settings
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding up to `capacity`."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (default: one second's worth of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` tokens are available, then take them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve up front so the sleep below happens outside the lock
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+@lru_cache(maxsize=None)
+def get_youtube_api_limiter() -> TokenBucket:
+    """Get the bucket shared by every YouTubeClient so concurrent extraction stays under the quota rate."""
+    return TokenBucket(get_settings().youtube_api_qps)